@@ -2,23 +2,50 @@
 Unified Satellite Dashboard - Main API Server
 Combines environmental monitoring, satellite tracking, and real satellite data analysis
 """
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from functools import lru_cache
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import math
+import threading
+import orjson
 import os
 from dotenv import load_dotenv
+from anyio import to_thread as anyio_to_thread
+import httpx
 import numpy as np
 import rasterio
-from rasterio.warp import transform as rasterio_transform
+from rasterio.enums import Resampling
+from rasterio.warp import transform as rasterio_transform, transform_bounds
+from rasterio.windows import from_bounds as window_from_bounds
 # Real satellite data integration
 import planetary_computer
 import requests
 from pystac_client import Client
 
+# Try to import rio-tiler for optimized COG reads
+try:
+    from rio_tiler.io import COGReader
+    RIO_TILER_AVAILABLE = True
+except ImportError:
+    RIO_TILER_AVAILABLE = False
+    COGReader = None
+
+# Try to import numba for JIT-compiled index math
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Import services
 from services.environmental import (
     generate_synthetic_satellite_data,
@@ -33,8 +60,10 @@ from services.satellite import (
     generate_satellite_position,
     predict_next_pass,
     get_satellite_telemetry,
+    generate_constellation_telemetry,
     calculate_fusion_metrics,
 )
+from services.spatial_index import SatelliteSpatialIndex
 from services.ai_insights import (
     generate_environmental_insights,
     generate_satellite_insights,
@@ -48,8 +77,13 @@ from services.disaster_layers import (
     generate_cyclone_tracks,
     generate_landslide_risk,
     get_all_disaster_layers,
+    summarize_disaster_layers,
 )
 
+# Shared RNG: the Generator API is faster per call than legacy np.random.*
+# and avoids the global-singleton lock
+_rng = np.random.default_rng()
+
 # Load environment variables
 load_dotenv()
 
@@ -57,11 +91,55 @@ load_dotenv()
 PC_STAC_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
 PC_TILE_URL = "https://planetarycomputer.microsoft.com/api/data/v1/item/tiles"
 
+# Shared async HTTP client for direct STAC calls; HTTP/2 multiplexes all
+# in-flight queries over one connection
+_HTTPX = httpx.AsyncClient(http2=True, timeout=30.0)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan.
+
+    Keeps one GDAL environment open for the whole process so the CURL
+    connection pool and VSI block cache persist across requests instead
+    of being torn down by per-call rasterio.Env() contexts.
+    """
+    gdal_env = rasterio.Env(
+        GDAL_CACHEMAX=512,
+        VSI_CACHE="TRUE",
+        VSI_CACHE_SIZE="1073741824",
+        GDAL_HTTP_MULTIPLEX="YES",
+        GDAL_HTTP_VERSION="2",
+        GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR",
+        CPL_VSIL_CURL_ALLOWED_EXTENSIONS=".tif,.TIF",
+    )
+    gdal_env.__enter__()
+    # Size the default thread pool so to_thread dispatches (regions,
+    # disaster layers, STAC calls) can actually saturate the cores
+    anyio_to_thread.current_default_thread_limiter().total_tokens = max(32, (os.cpu_count() or 1) * 4)
+    janitor = asyncio.create_task(_cache_janitor())
+    try:
+        yield
+    finally:
+        janitor.cancel()
+        gdal_env.__exit__(None, None, None)
+        await _HTTPX.aclose()
+
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSON response that serializes numpy arrays and scalars natively"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Unified Satellite Dashboard API",
     description="Environmental monitoring, satellite tracking, and real satellite data analysis",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=NumpyORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -76,6 +154,33 @@ app.add_middleware(
 # GZip compression for responses > 1KB
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+
+def conditional_response(request: Request, payload: Any, max_age: int,
+                         etag_source: Any = None) -> Response:
+    """
+    Wrap a slow-changing payload with Cache-Control and ETag headers.
+
+    Answers 304 Not Modified when the client's If-None-Match still matches,
+    so polling dashboards skip the response body entirely.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        payload: Response payload
+        max_age: Cache-Control max-age in seconds
+        etag_source: Stable part of the payload to hash (defaults to payload)
+
+    Returns:
+        A 304 response or the serialized payload with cache headers
+    """
+    source = payload if etag_source is None else etag_source
+    etag = '"%s"' % hashlib.blake2b(
+        orjson.dumps(source, option=orjson.OPT_SERIALIZE_NUMPY), digest_size=8
+    ).hexdigest()
+    headers = {"Cache-Control": f"public, max-age={max_age}", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return NumpyORJSONResponse(payload, headers=headers)
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -88,6 +193,8 @@ async def health_check():
 
 class Alert(BaseModel):
     """Environmental risk alert"""
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     id: str
     level: str
     title: str
@@ -100,6 +207,8 @@ class Alert(BaseModel):
 
 class RiskResponse(BaseModel):
     """Risk analysis response"""
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     geojson: Dict
     alerts: List[Alert]
     confidence: float
@@ -141,10 +250,66 @@ class NdviRequest(BaseModel):
     lat: float
 
 
+class SatelliteListResponse(BaseModel):
+    """List of tracked satellites"""
+    satellites: List[SatelliteResponse]
+    count: int
+    timestamp: str
+
+
+class PassEntry(BaseModel):
+    """One predicted satellite pass"""
+    satellite_name: str
+    start_time: str
+    end_time: str
+    duration_seconds: int
+    max_elevation: int
+    visibility: str
+    observer_lat: float
+    observer_lon: float
+
+
+class PassesResponse(BaseModel):
+    """Pass predictions for the constellation"""
+    passes: List[PassEntry]
+    count: int
+    observer: Dict[str, float]
+    timestamp: str
+
+
+class FusionMetrics(BaseModel):
+    """Aggregated data fusion metrics"""
+    total_coverage_area_km2: float
+    average_altitude_km: float
+    average_velocity_kmh: float
+    fusion_accuracy: float
+    data_throughput_mbps: float
+    active_satellites_count: int
+    timestamp: Optional[str] = None
+
+
+class FusionMetricsResponse(BaseModel):
+    """Fusion metrics endpoint response"""
+    metrics: FusionMetrics
+    ai_insights: Optional[Dict[str, Any]] = None
+    timestamp: str
+
+
 # In-memory satellite storage (replace with database in production)
 satellites_db = [dict(sat, is_active=True) for sat in DEFAULT_SATELLITES]
 next_satellite_id = len(satellites_db) + 1
 
+# Dict indexes kept in sync with satellites_db for O(1) lookups
+satellites_by_id = {sat["id"]: sat for sat in satellites_db}
+satellites_by_norad = {sat["norad_id"]: sat for sat in satellites_db}
+
+# R*Tree index of last-known positions; seeded here and refreshed on
+# every telemetry update for "satellites near a point" queries
+satellite_index = SatelliteSpatialIndex()
+for _sat in satellites_db:
+    _pos = generate_satellite_position(_sat["id"])
+    satellite_index.update(_sat["id"], _pos["latitude"], _pos["longitude"])
+
 
 # ============================================================================
 # REAL SATELLITE DATA FUNCTIONS
@@ -153,74 +318,295 @@ next_satellite_id = len(satellites_db) + 1
 # Cache for STAC search results
 from typing import Tuple
 from datetime import timedelta
+import json
+
+from cachetools import TTLCache
+
+# Try to import redis for a shared cache backend
+try:
+    import redis as redis_lib
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_lib = None
+    REDIS_AVAILABLE = False
 
-STAC_CACHE: Dict[Tuple[str, str], Tuple[List[Dict[str, Any]], datetime]] = {}
 CACHE_DURATION = timedelta(minutes=30)
+CACHE_TTL_SECONDS = int(CACHE_DURATION.total_seconds())
+
+
+def _stac_cache_key(collections: List[str], bbox: List[float], start: str, end: str, limit: int) -> bytes:
+    """
+    Stable 16-byte cache key for a STAC search.
+
+    Hashing the serialized query gives a fixed-size bytes key that hashes
+    in one step, and normalizing bbox values to float keeps [1, 2] and
+    [1.0, 2.0] from producing distinct entries.
+    """
+    payload = orjson.dumps([sorted(collections), [float(v) for v in bbox], start, end, int(limit)])
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class StacSearchCache:
+    """
+    TTL cache for STAC search results.
+
+    Uses a shared Redis backend when REDIS_URL is configured, so cached
+    searches survive reloads and are shared across workers. Falls back to
+    an in-process cachetools.TTLCache otherwise, which evicts expired
+    entries atomically instead of relying on manual sweeps.
+    """
+
+    def __init__(self, prefix: str = "sat:stac:"):
+        self._prefix = prefix
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and REDIS_AVAILABLE:
+            try:
+                self._redis = redis_lib.Redis.from_url(redis_url)
+                self._redis.ping()
+                print("✓ STAC cache using Redis backend")
+            except Exception as e:
+                print(f"⚠ Redis unavailable, using in-memory cache: {e}")
+                self._redis = None
+        # TTLCache is not thread-safe and gets hit from both the event
+        # loop and to_thread workers, so all access goes through a lock
+        self._local: TTLCache = TTLCache(maxsize=256, ttl=CACHE_TTL_SECONDS)
+        self._local_lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(self._prefix + key.hex())
+                return json.loads(raw) if raw is not None else None
+            except Exception as e:
+                print(f"⚠ Redis get failed: {e}")
+        with self._local_lock:
+            return self._local.get(key)
+
+    def set(self, key: bytes, items: List[Dict[str, Any]]) -> None:
+        if self._redis is not None:
+            try:
+                self._redis.set(self._prefix + key.hex(), json.dumps(items), ex=CACHE_TTL_SECONDS)
+                return
+            except Exception as e:
+                print(f"⚠ Redis set failed: {e}")
+        with self._local_lock:
+            self._local[key] = items
+
+    async def get_async(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Event-loop-safe get: Redis I/O hops to a worker thread"""
+        if self._redis is not None:
+            return await asyncio.to_thread(self.get, key)
+        return self.get(key)
+
+    async def set_async(self, key: bytes, items: List[Dict[str, Any]]) -> None:
+        """Event-loop-safe set: Redis I/O hops to a worker thread"""
+        if self._redis is not None:
+            await asyncio.to_thread(self.set, key, items)
+            return
+        self.set(key, items)
+
+    def expire(self) -> None:
+        """Drop expired entries from the in-memory backend"""
+        with self._local_lock:
+            self._local.expire()
+
+
+STAC_CACHE = StacSearchCache()
+
+# Reuse one STAC client so the conformance fetch and TLS handshake happen
+# once and keep-alive spans requests
+_STAC_CLIENT: Optional[Client] = None
+
+
+def get_stac_client() -> Client:
+    """Get the shared pystac Client, opening it on first use"""
+    global _STAC_CLIENT
+    if _STAC_CLIENT is None:
+        _STAC_CLIENT = Client.open(PC_STAC_URL)
+    return _STAC_CLIENT
+
+# Signed STAC items keyed by (collection, item_id). Planetary Computer
+# signatures are valid ~30 minutes; keep a shorter TTL so cached HREFs
+# never go stale mid-request
+SIGNED_ITEM_TTL = timedelta(minutes=25)
+SIGNED_ITEM_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, Any], datetime]] = {}
+
+
+async def _cache_janitor(interval_seconds: float = 300) -> None:
+    """
+    Periodically evict expired cache entries.
+
+    Runs as a background task so eviction never happens on the request
+    path; the signed-item dict would otherwise grow unbounded.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        STAC_CACHE.expire()
+        cutoff = datetime.now() - SIGNED_ITEM_TTL
+        stale = [k for k, (_, signed_at) in list(SIGNED_ITEM_CACHE.items()) if signed_at < cutoff]
+        for key in stale:
+            SIGNED_ITEM_CACHE.pop(key, None)
+
+
+def sign_item_cached(collection: str, item_id: str, item) -> Dict[str, Any]:
+    """
+    Sign a STAC item, reusing a recently signed copy when available.
+
+    Signing issues an HTTP call to the Planetary Computer signing endpoint
+    per item, so cache hits skip one roundtrip each.
+    """
+    cached = SIGNED_ITEM_CACHE.get((collection, item_id))
+    if cached is not None and datetime.now() - cached[1] < SIGNED_ITEM_TTL:
+        return cached[0]
+
+    signed = planetary_computer.sign(item)
+    signed_dict = signed.to_dict() if hasattr(signed, "to_dict") else signed
+    SIGNED_ITEM_CACHE[(collection, item_id)] = (signed_dict, datetime.now())
+    return signed_dict
+
+
+def get_signed_item(collection: str, item_id: str) -> Dict[str, Any]:
+    """Fetch and sign a single STAC item, reusing the signed-item cache"""
+    cached = SIGNED_ITEM_CACHE.get((collection, item_id))
+    if cached is not None and datetime.now() - cached[1] < SIGNED_ITEM_TTL:
+        return cached[0]
+
+    client = get_stac_client()
+    item_obj = client.get_collection(collection).get_item(item_id)
+    return sign_item_cached(collection, item_id, item_obj)
+
+@lru_cache(maxsize=1024)
+def _cos_lat(lat_rounded: float) -> float:
+    """Cosine of latitude, memoized on the rounded value"""
+    return math.cos(math.radians(lat_rounded))
+
 
 def bbox_from_point(lat: float, lon: float, radius_km: float = 40) -> List[float]:
     """
     Create bounding box from center point.
-    
+
     Args:
         lat: Center latitude
         lon: Center longitude
         radius_km: Radius in kilometers
-    
+
     Returns:
         [minx, miny, maxx, maxy] bounding box
     """
-    import math
     dlat = radius_km / 111.0
-    dlon = radius_km / (111.0 * math.cos(math.radians(lat)))
+    dlon = radius_km / (111.0 * _cos_lat(round(lat, 3)))
     return [lon - dlon, lat - dlat, lon + dlon, lat + dlat]
 
 
-def stac_search(collections: List[str], bbox: List[float], start: str, end: str, limit: int) -> List[Dict[str, Any]]:
+async def stac_search(collections: List[str], bbox: List[float], start: str, end: str, limit: int) -> List[Dict[str, Any]]:
     """
     Search for satellite imagery using STAC API with caching.
-    
+
+    Posts directly to the STAC /search endpoint over the shared HTTP/2
+    client instead of going through the blocking pystac_client/requests
+    stack, so concurrent searches don't serialize on the event loop.
+
     Args:
         collections: List of collection IDs (e.g., ["sentinel-2-l2a"])
         bbox: Bounding box [minx, miny, maxx, maxy]
         start: Start date ISO format
         end: End date ISO format
         limit: Maximum items to return
-    
+
     Returns:
         List of STAC items
     """
     # Create cache key
-    cache_key = (str(collections), str(bbox), start, end, str(limit))
-    
+    cache_key = _stac_cache_key(collections, bbox, start, end, limit)
+
     # Check cache
-    if cache_key in STAC_CACHE:
-        cached_items, cached_time = STAC_CACHE[cache_key]
-        if datetime.now() - cached_time < CACHE_DURATION:
-            return cached_items
-    
+    cached_items = await STAC_CACHE.get_async(cache_key)
+    if cached_items is not None:
+        return cached_items
+
+    try:
+        response = await _HTTPX.post(f"{PC_STAC_URL}/search", json={
+            "collections": collections,
+            "bbox": bbox,
+            "datetime": f"{start}/{end}",
+            "limit": limit,
+        })
+        response.raise_for_status()
+        features = response.json().get("features", [])
+
+        # Signing issues blocking HTTP calls on cache misses; sign the
+        # batch in a thread pool off the event loop
+        def _sign_all(feats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                return list(executor.map(
+                    lambda feat: sign_item_cached(feat.get("collection", ""), feat["id"], feat),
+                    feats,
+                ))
+
+        items = await asyncio.to_thread(_sign_all, features)
+
+        # Cache results
+        await STAC_CACHE.set_async(cache_key, items)
+
+        return items
+    except Exception as e:
+        print(f"Error in STAC search: {e}")
+        return []
+
+
+def stac_search_extremes(collections: List[str], bbox: List[float], start: str, end: str,
+                         limit: int) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], int]:
+    """
+    Return the (oldest, newest) signed items from a STAC search.
+
+    Streams the unsigned result set in one pass and signs only the two
+    items actually used, instead of signing and materializing the whole
+    page set the way stac_search does.
+
+    Returns:
+        (oldest_item, newest_item, total_count); items are None when the
+        search comes back empty
+    """
+    cache_key = _stac_cache_key(collections, bbox, start, end, limit)
+    cached = STAC_CACHE.get(cache_key)
+    if cached:
+        # Already-signed full result set from a previous stac_search call
+        items_sorted = sorted(cached, key=lambda x: x.get("properties", {}).get("datetime", ""))
+        return items_sorted[0], items_sorted[-1], len(items_sorted)
+
     try:
-        client = Client.open(PC_STAC_URL)
+        client = get_stac_client()
         search = client.search(
             collections=collections,
             bbox=bbox,
             datetime=f"{start}/{end}",
             limit=limit
         )
-        items = [planetary_computer.sign(item).to_dict() for item in search.items()]
-        
-        # Cache results
-        STAC_CACHE[cache_key] = (items, datetime.now())
-        
-        # Clean old cache entries
-        if len(STAC_CACHE) > 50:
-            old_keys = [k for k, (_, t) in STAC_CACHE.items() if datetime.now() - t > CACHE_DURATION]
-            for k in old_keys:
-                del STAC_CACHE[k]
-        
-        return items
+
+        oldest = newest = None
+        oldest_dt = newest_dt = None
+        count = 0
+        for item in search.items():
+            count += 1
+            dt = item.properties.get("datetime") or ""
+            dt = dt if isinstance(dt, str) else dt.isoformat()
+            if oldest_dt is None or dt < oldest_dt:
+                oldest, oldest_dt = item, dt
+            if newest_dt is None or dt > newest_dt:
+                newest, newest_dt = item, dt
+
+        if oldest is None:
+            return None, None, 0
+
+        return (
+            sign_item_cached(oldest.collection_id, oldest.id, oldest),
+            sign_item_cached(newest.collection_id, newest.id, newest),
+            count,
+        )
     except Exception as e:
         print(f"Error in STAC search: {e}")
-        return []
+        return None, None, 0
 
 
 def find_asset(item: Dict[str, Any], candidates: List[str]) -> Optional[Dict[str, Any]]:
@@ -232,36 +618,205 @@ def find_asset(item: Dict[str, Any], candidates: List[str]) -> Optional[Dict[str
     return None
 
 
+def sample_band_values(asset_href: str, lons: List[float], lats: List[float]) -> Optional[np.ndarray]:
+    """
+    Sample many pixel values from a raster asset in one open.
+
+    Transforms the whole coordinate batch in a single CRS call and streams
+    the reads through dataset.sample instead of constructing one window
+    per point.
+
+    Args:
+        asset_href: URL to the raster asset
+        lons: Longitudes (EPSG:4326)
+        lats: Latitudes (EPSG:4326)
+
+    Returns:
+        Float array with NaN for nodata pixels, or None if sampling fails
+    """
+    try:
+        with rasterio.open(asset_href) as dataset:
+            xs, ys = list(lons), list(lats)
+            if dataset.crs and dataset.crs.to_string() != "EPSG:4326":
+                xs, ys = rasterio_transform("EPSG:4326", dataset.crs, xs, ys)
+            values = np.fromiter(
+                (v[0] for v in dataset.sample(zip(xs, ys))),
+                dtype=np.float64,
+                count=len(xs),
+            )
+            if dataset.nodata is not None:
+                values[values == dataset.nodata] = np.nan
+            return values
+    except Exception as e:
+        print(f"Error sampling band: {e}")
+        return None
+
+
 def sample_band_value(asset_href: str, lon: float, lat: float) -> Optional[float]:
     """
     Sample a single pixel value from a raster asset.
-    
+
     Args:
         asset_href: URL to the raster asset
         lon: Longitude
         lat: Latitude
-    
+
     Returns:
         Float value or None if sampling fails
     """
-    try:
-        with rasterio.Env():
-            with rasterio.open(asset_href) as dataset:
-                x, y = lon, lat
-                if dataset.crs and dataset.crs.to_string() != "EPSG:4326":
-                    x, y = rasterio_transform("EPSG:4326", dataset.crs, [lon], [lat])
-                    x, y = x[0], y[0]
-                row, col = dataset.index(x, y)
-                window = rasterio.windows.Window(col_off=col, row_off=row, width=1, height=1)
-                data = dataset.read(1, window=window, masked=True)
-                if data.size == 0 or data.mask[0, 0]:
+    if RIO_TILER_AVAILABLE:
+        try:
+            # Overview-aware point sampling with a single ranged read;
+            # the masked-array interface keeps nodata pixels out
+            with COGReader(asset_href) as cog:
+                pt = cog.point(lon, lat).array
+                if np.ma.getmaskarray(pt)[0]:
                     return None
-                return float(data[0, 0])
+                return float(pt.data[0])
+        except Exception as e:
+            print(f"rio-tiler point read failed, trying rasterio: {e}")
+    try:
+        values = sample_band_values(asset_href, [lon], [lat])
+        if values is None or np.isnan(values[0]):
+            return None
+        return float(values[0])
     except Exception as e:
         print(f"Error sampling band: {e}")
         return None
 
 
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the parallel threading layer can deadlock at
+    # interpreter exit when first initialized off the main thread, and
+    # these grids are small enough that fan-out would not pay anyway
+    @njit(fastmath=True, cache=True)
+    def _ndi_kernel(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Fused (a - b) / (a + b) over flat arrays; zero-sum pixels -> 0"""
+        a1 = a.ravel()
+        b1 = b.ravel()
+        out = np.empty(a1.size, dtype=np.float64)
+        for i in range(a1.size):
+            s = a1[i] + b1[i]
+            out[i] = (a1[i] - b1[i]) / s if s != 0.0 else 0.0
+        return out.reshape(a.shape)
+
+
+def normalized_difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Compute the normalized difference index (a - b) / (a + b).
+
+    Uses a fused numba kernel when available (single pass, releases the
+    GIL); falls back to the equivalent NumPy expression otherwise.
+    """
+    if NUMBA_AVAILABLE:
+        return _ndi_kernel(np.ascontiguousarray(a), np.ascontiguousarray(b))
+    total = a + b
+    return np.where(total != 0, (a - b) / np.where(total != 0, total, 1), 0.0)
+
+
+def read_band_window(asset_href: str, bbox: List[float], grid_size: int) -> Optional[np.ndarray]:
+    """
+    Read a bbox from a raster asset as a single windowed request.
+
+    Opens the COG once and issues one range read for the whole window,
+    decimated to the requested grid size, instead of per-pixel reads.
+
+    Args:
+        asset_href: URL to the raster asset
+        bbox: Bounding box [minx, miny, maxx, maxy] in EPSG:4326
+        grid_size: Output grid size (grid_size x grid_size)
+
+    Returns:
+        Float array of shape (grid_size, grid_size) with NaN for masked
+        pixels, or None if the read fails
+    """
+    if RIO_TILER_AVAILABLE:
+        try:
+            # rio-tiler picks the overview level matching the requested
+            # size and aligns the request to internal COG tiles, so a
+            # coarse grid over a wide bbox never touches full-res data
+            with COGReader(asset_href) as cog:
+                img = cog.part(bbox, width=grid_size, height=grid_size, indexes=[1])
+                return img.array[0].astype(np.float64).filled(np.nan)
+        except Exception as e:
+            print(f"rio-tiler window read failed, trying rasterio: {e}")
+    try:
+        with rasterio.open(asset_href) as dataset:
+            dst_bounds = bbox
+            if dataset.crs and dataset.crs.to_string() != "EPSG:4326":
+                dst_bounds = transform_bounds("EPSG:4326", dataset.crs, *bbox)
+            window = window_from_bounds(*dst_bounds, transform=dataset.transform)
+            # Clamp to the dataset so the decimated read is served from
+            # the overview pyramid (boundless reads go through a VRT
+            # that bypasses overviews)
+            window = window.intersection(
+                rasterio.windows.Window(0, 0, dataset.width, dataset.height)
+            )
+            if window.width <= 0 or window.height <= 0:
+                return None
+            data = dataset.read(
+                1,
+                window=window,
+                out_shape=(grid_size, grid_size),
+                resampling=Resampling.bilinear,
+                masked=True,
+            )
+            return data.astype(np.float64).filled(np.nan)
+    except Exception as e:
+        print(f"Error reading band window: {e}")
+        return None
+
+
+def compute_index_grid(item: Dict[str, Any], bands_a: List[str], bands_b: List[str],
+                       bbox: List[float], grid_size: int) -> Optional[np.ndarray]:
+    """
+    Compute a normalized-difference index grid from a satellite item.
+
+    Reads each band with one windowed request and returns
+    (a - b) / (a + b) as a (grid_size, grid_size) array, so callers feed
+    arrays straight into the risk kernels with no scalar round-trip.
+
+    Args:
+        item: STAC item dictionary
+        bands_a: Asset name candidates for the first band
+        bands_b: Asset name candidates for the second band
+        bbox: Bounding box [minx, miny, maxx, maxy] in EPSG:4326
+        grid_size: Output grid size (grid_size x grid_size)
+
+    Returns:
+        Index array of shape (grid_size, grid_size) or None
+    """
+    asset_a = find_asset(item, bands_a)
+    asset_b = find_asset(item, bands_b)
+
+    if not asset_a or not asset_b:
+        return None
+
+    a = read_band_window(asset_a["href"], bbox, grid_size)
+    b = read_band_window(asset_b["href"], bbox, grid_size)
+
+    if a is None or b is None:
+        return None
+
+    return normalized_difference(a, b)
+
+
+def compute_ndwi_grid(item: Dict[str, Any], bbox: List[float], grid_size: int) -> Optional[np.ndarray]:
+    """Compute an NDWI grid, (green - nir) / (green + nir), over a bbox"""
+    if item.get("collection") == "sentinel-2-l2a":
+        return compute_index_grid(item, ["B03", "green"], ["B08", "nir", "nir08"], bbox, grid_size)
+    # Landsat
+    return compute_index_grid(item, ["green", "SR_B3", "B3"], ["nir08", "SR_B5", "B5", "nir"], bbox, grid_size)
+
+
+def compute_ndvi_grid(item: Dict[str, Any], bbox: List[float], grid_size: int) -> Optional[np.ndarray]:
+    """Compute an NDVI grid, (nir - red) / (nir + red), over a bbox"""
+    if item.get("collection") == "sentinel-2-l2a":
+        return compute_index_grid(item, ["B08", "nir", "nir08"], ["B04", "red"], bbox, grid_size)
+    # Landsat
+    return compute_index_grid(item, ["nir08", "SR_B5", "B5", "nir"], ["red", "SR_B4", "B4"], bbox, grid_size)
+
+
 def compute_ndvi(item: Dict[str, Any], lon: float, lat: float) -> Optional[float]:
     """
     Compute NDVI from satellite item.
@@ -339,55 +894,85 @@ def compute_ndwi_from_satellite(item: Dict[str, Any], lon: float, lat: float) ->
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _cached_synthetic_data(lat: float, lon: float, grid_size: int):
+    return generate_synthetic_satellite_data(lat, lon, grid_size)
+
+
+def cached_synthetic_data(lat: float, lon: float, grid_size: int):
+    """
+    Memoized synthetic satellite data for a rounded location.
+
+    The generator is deterministic for a given (lat, lon, grid_size), so
+    hot coordinates (e.g. the fixed national regions) skip the RNG and
+    grid synthesis entirely. Callers must treat the arrays as read-only.
+    """
+    return _cached_synthetic_data(round(lat, 4), round(lon, 4), grid_size)
+
+
+_ALERT_TEMPLATES = {
+    "HIGH": {
+        "title": "Critical Erosion Risk Detected",
+        "description": "Significant water expansion detected in {location}. Area: {area}km²."
+    },
+    "MEDIUM": {
+        "title": "Moderate Risk Area Identified",
+        "description": "Water level changes observed in {location}. Area: {area}km²."
+    },
+    "LOW": {
+        "title": "Low Risk Alert",
+        "description": "Minor changes detected in {location}. Area: {area}km²."
+    }
+}
+
+_RISK_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
+
 def generate_alerts_from_geojson(geojson: Dict) -> List[Alert]:
     """Generate structured alerts from GeoJSON risk zones"""
     alerts = []
-    
-    alert_templates = {
-        "HIGH": {
-            "title": "Critical Erosion Risk Detected",
-            "description": "Significant water expansion detected in {location}. Area: {area}km²."
-        },
-        "MEDIUM": {
-            "title": "Moderate Risk Area Identified",
-            "description": "Water level changes observed in {location}. Area: {area}km²."
-        },
-        "LOW": {
-            "title": "Low Risk Alert",
-            "description": "Minor changes detected in {location}. Area: {area}km²."
-        }
-    }
-    
+
     features = geojson.get("features", [])
-    for idx, feature in enumerate(features):
-        props = feature["properties"]
-        level = props["risk_level"]
-        
-        location = f"Region ({props['center_lat']:.2f}°N, {props['center_lon']:.2f}°E)"
-        confidence = min(95, 60 + (props["risk_score"] - 40) * 0.7)
-        confidence = max(50, confidence)
-        
-        alert = Alert(
-            id=f"ALERT-{datetime.now().strftime('%Y%m%d')}-{idx:03d}",
+    if not features:
+        return []
+
+    # One clock read for all alerts in this batch
+    now = datetime.now()
+    timestamp = now.isoformat()
+    date_tag = now.strftime('%Y%m%d')
+
+    props = [f["properties"] for f in features]
+    count = len(props)
+
+    # Compute confidences and the sort order in bulk instead of per alert
+    scores = np.fromiter((p["risk_score"] for p in props), dtype=float, count=count)
+    areas = np.fromiter((p["area_km2"] for p in props), dtype=float, count=count)
+    risk_rank = np.fromiter((_RISK_ORDER[p["risk_level"]] for p in props), dtype=np.int64, count=count)
+    confidences = np.clip(60 + (scores - 40) * 0.7, 50, 95)
+    order = np.lexsort((-areas, risk_rank))
+
+    for idx in order:
+        p = props[idx]
+        level = p["risk_level"]
+        location = f"Region ({p['center_lat']:.2f}°N, {p['center_lon']:.2f}°E)"
+
+        alerts.append(Alert(
+            id=f"ALERT-{date_tag}-{idx:03d}",
             level=level,
-            title=alert_templates[level]["title"],
-            description=alert_templates[level]["description"].format(
+            title=_ALERT_TEMPLATES[level]["title"],
+            description=_ALERT_TEMPLATES[level]["description"].format(
                 location=location,
-                area=f"{props['area_km2']:.1f}"
+                area=f"{p['area_km2']:.1f}"
             ),
-            area_km2=props["area_km2"],
-            confidence=confidence,
-            timestamp=datetime.now().isoformat(),
+            area_km2=p["area_km2"],
+            confidence=float(confidences[idx]),
+            timestamp=timestamp,
             location={
-                "lat": props["center_lat"],
-                "lon": props["center_lon"]
+                "lat": p["center_lat"],
+                "lon": p["center_lon"]
             }
-        )
-        alerts.append(alert)
-    
-    risk_order = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
-    alerts.sort(key=lambda x: (risk_order[x.level], -x.area_km2))
-    
+        ))
+
     return alerts
 
 
@@ -449,7 +1034,7 @@ async def health_check():
 # ENVIRONMENTAL MONITORING ENDPOINTS
 # ============================================================================
 
-@app.get("/api/environmental/risk", response_model=RiskResponse, tags=["Environmental"])
+@app.get("/api/environmental/risk", tags=["Environmental"])
 async def get_risk_analysis(
     lat: float = 26.0,
     lon: float = 92.0,
@@ -468,7 +1053,7 @@ async def get_risk_analysis(
             raise HTTPException(400, "Grid size must be 20-100")
         
         # Generate synthetic data
-        old_ndwi, new_ndwi, dem, rainfall = generate_synthetic_satellite_data(lat, lon, grid_size)
+        old_ndwi, new_ndwi, dem, rainfall = cached_synthetic_data(lat, lon, grid_size)
         
         # Calculate risk
         water_change = detect_water_change(old_ndwi, new_ndwi)
@@ -496,14 +1081,15 @@ async def get_risk_analysis(
         
         ai_insights = generate_environmental_insights(metadata, alerts, overall_confidence)
         
-        return RiskResponse(
+        # Serialize directly so FastAPI skips re-validating the response
+        return ORJSONResponse(RiskResponse(
             geojson=geojson,
             alerts=alerts,
             confidence=overall_confidence,
             timestamp=datetime.now().isoformat(),
             metadata=metadata,
             ai_insights=ai_insights
-        )
+        ).model_dump())
     
     except HTTPException:
         raise
@@ -528,33 +1114,43 @@ async def get_national_risk_analysis():
         {"lat": 21.0, "lon": 79.0, "name": "Central India Rivers"},
     ]
 
+    def process_region(region: Dict) -> Tuple[List[Dict], List[Alert]]:
+        """Run the full risk pipeline for a single region"""
+        lat, lon = region["lat"], region["lon"]
+
+        old_ndwi, new_ndwi, dem, rainfall = cached_synthetic_data(lat, lon, 30)
+
+        water_change = detect_water_change(old_ndwi, new_ndwi)
+        slope_factor = calculate_slope_factor(dem)
+        rainfall_factor = calculate_rainfall_factor(rainfall)
+        risk_score = calculate_risk_score(water_change, slope_factor, rainfall_factor)
+
+        geojson = generate_risk_geojson(risk_score, lat, lon)
+
+        features = []
+        if geojson and "features" in geojson:
+            for feature in geojson["features"]:
+                feature["properties"]["region_name"] = region["name"]
+                features.append(feature)
+
+        region_alerts = generate_alerts_from_geojson(geojson)
+        for alert in region_alerts:
+            alert.description = alert.description.replace("Region", region["name"])
+
+        return features, region_alerts
+
     all_features = []
     all_alerts = []
 
     try:
-        for region in key_regions:
-            lat, lon = region["lat"], region["lon"]
-            
-            old_ndwi, new_ndwi, dem, rainfall = generate_synthetic_satellite_data(
-                lat_center=lat, lon_center=lon, grid_size=30
-            )
-            
-            water_change = detect_water_change(old_ndwi, new_ndwi)
-            slope_factor = calculate_slope_factor(dem)
-            rainfall_factor = calculate_rainfall_factor(rainfall)
-            risk_score = calculate_risk_score(water_change, slope_factor, rainfall_factor)
-            
-            geojson = generate_risk_geojson(risk_score, lat, lon)
-            
-            if geojson and "features" in geojson:
-                for feature in geojson["features"]:
-                    feature["properties"]["region_name"] = region["name"]
-                    all_features.append(feature)
-            
-            region_alerts = generate_alerts_from_geojson(geojson)
-            for alert in region_alerts:
-                alert.description = alert.description.replace("Region", region["name"])
-                all_alerts.append(alert)
+        # Regions are independent; NumPy releases the GIL so threads give
+        # real parallelism for this CPU-bound work
+        results = await asyncio.gather(
+            *(asyncio.to_thread(process_region, region) for region in key_regions)
+        )
+        for features, region_alerts in results:
+            all_features.extend(features)
+            all_alerts.extend(region_alerts)
 
         combined_geojson = {
             "type": "FeatureCollection",
@@ -576,20 +1172,20 @@ async def get_national_risk_analysis():
 
         ai_insights = generate_environmental_insights(metadata, all_alerts, overall_confidence)
 
-        return RiskResponse(
+        return ORJSONResponse(RiskResponse(
             geojson=combined_geojson,
             alerts=all_alerts,
             confidence=overall_confidence,
             timestamp=datetime.now().isoformat(),
             metadata=metadata,
             ai_insights=ai_insights
-        )
+        ).model_dump())
 
     except Exception as e:
         raise HTTPException(500, f"National analysis error: {str(e)}")
 
 
-@app.get("/api/environmental/risk/real", response_model=RiskResponse, tags=["Environmental"])
+@app.get("/api/environmental/risk/real", tags=["Environmental"])
 async def get_real_risk_analysis(
     lat: float = 26.0,
     lon: float = 92.0,
@@ -615,48 +1211,40 @@ async def get_real_risk_analysis(
         # Search for recent satellite imagery
         bbox = bbox_from_point(lat, lon, radius_km)
         end_date = datetime.now()
-        start_date = datetime.now().replace(day=max(1, datetime.now().day - days_back))
+        start_date = end_date.replace(day=max(1, end_date.day - days_back))
         
-        items = stac_search(
+        # Only the oldest and newest items are used; stream the search and
+        # sign just those two
+        old_item, new_item, item_count = await asyncio.to_thread(
+            stac_search_extremes,
             collections=["sentinel-2-l2a"],
             bbox=bbox,
             start=start_date.isoformat(),
             end=end_date.isoformat(),
             limit=10
         )
-        
-        if not items:
+
+        if not old_item:
             raise HTTPException(404, "No satellite imagery found for this location and time period")
-        
-        # Use most recent item as "new" and older item as "old"
-        items_sorted = sorted(items, key=lambda x: x.get("properties", {}).get("datetime", ""))
-        
-        if len(items_sorted) < 2:
+
+        if item_count < 2:
             raise HTTPException(404, "Need at least 2 images for change detection")
         
-        old_item = items_sorted[0]
-        new_item = items_sorted[-1]
-        
-        # Sample NDWI values in a grid around the center point
+        # Read NDWI grids with one windowed request per band
         grid_size = 30
-        deg_per_pixel = (radius_km * 2) / (111.0 * grid_size)
-        
-        old_ndwi_grid = np.zeros((grid_size, grid_size))
-        new_ndwi_grid = np.zeros((grid_size, grid_size))
-        
-        for i in range(grid_size):
-            for j in range(grid_size):
-                sample_lat = lat - radius_km/111.0 + (i * deg_per_pixel)
-                sample_lon = lon - radius_km/111.0 + (j * deg_per_pixel)
-                
-                old_val = compute_ndwi_from_satellite(old_item, sample_lon, sample_lat)
-                new_val = compute_ndwi_from_satellite(new_item, sample_lon, sample_lat)
-                
-                old_ndwi_grid[i, j] = old_val if old_val is not None else -0.1
-                new_ndwi_grid[i, j] = new_val if new_val is not None else -0.1
+
+        old_ndwi_grid = compute_ndwi_grid(old_item, bbox, grid_size)
+        new_ndwi_grid = compute_ndwi_grid(new_item, bbox, grid_size)
+
+        if old_ndwi_grid is None or new_ndwi_grid is None:
+            raise HTTPException(502, "Failed to read satellite bands for this location")
+
+        # Treat unreadable pixels as dry land
+        old_ndwi_grid = np.nan_to_num(old_ndwi_grid, nan=-0.1)
+        new_ndwi_grid = np.nan_to_num(new_ndwi_grid, nan=-0.1)
         
         # Generate synthetic DEM and rainfall (no real data available easily)
-        _, _, dem, rainfall = generate_synthetic_satellite_data(lat, lon, grid_size)
+        _, _, dem, rainfall = cached_synthetic_data(lat, lon, grid_size)
         
         # Run risk detection
         water_change = detect_water_change(old_ndwi_grid, new_ndwi_grid)
@@ -673,7 +1261,7 @@ async def get_real_risk_analysis(
             "region": f"Analysis Center ({lat:.2f}°N, {lon:.2f}°E)",
             "center": {"lat": lat, "lon": lon},
             "analysis_type": "real_satellite",
-            "satellite_items": len(items_sorted),
+            "satellite_items": item_count,
             "old_image_date": old_item.get("properties", {}).get("datetime", ""),
             "new_image_date": new_item.get("properties", {}).get("datetime", ""),
             "grid_size": grid_size,
@@ -686,14 +1274,15 @@ async def get_real_risk_analysis(
         
         ai_insights = generate_environmental_insights(metadata, alerts, overall_confidence)
         
-        return RiskResponse(
+        # Serialize directly so FastAPI skips re-validating the response
+        return ORJSONResponse(RiskResponse(
             geojson=geojson,
             alerts=alerts,
             confidence=overall_confidence,
             timestamp=datetime.now().isoformat(),
             metadata=metadata,
             ai_insights=ai_insights
-        )
+        ).model_dump())
     
     except HTTPException:
         raise
@@ -725,7 +1314,7 @@ async def search_satellite_data(request: SearchRequest):
         if not request.collections:
             raise HTTPException(400, "At least one collection required")
         
-        items = stac_search(
+        items = await stac_search(
             collections=request.collections,
             bbox=request.bbox,
             start=request.start,
@@ -760,10 +1349,8 @@ async def compute_ndvi_endpoint(request: NdviRequest):
     ```
     """
     try:
-        client = Client.open(PC_STAC_URL)
-        item_obj = client.get_collection(request.collection).get_item(request.item_id)
-        signed = planetary_computer.sign(item_obj).to_dict()
-        
+        signed = get_signed_item(request.collection, request.item_id)
+
         ndvi = compute_ndvi(signed, request.lon, request.lat)
         
         return {
@@ -795,10 +1382,8 @@ async def compute_ndwi_endpoint(request: NdviRequest):
     ```
     """
     try:
-        client = Client.open(PC_STAC_URL)
-        item_obj = client.get_collection(request.collection).get_item(request.item_id)
-        signed = planetary_computer.sign(item_obj).to_dict()
-        
+        signed = get_signed_item(request.collection, request.item_id)
+
         ndwi = compute_ndwi_from_satellite(signed, request.lon, request.lat)
         
         return {
@@ -818,7 +1403,7 @@ async def compute_ndwi_endpoint(request: NdviRequest):
 # SATELLITE TRACKING ENDPOINTS
 # ============================================================================
 
-@app.get("/api/satellites", tags=["Satellites"])
+@app.get("/api/satellites", response_model=SatelliteListResponse, tags=["Satellites"])
 async def list_satellites():
     """List all tracked satellites"""
     return {
@@ -834,9 +1419,9 @@ async def add_satellite(satellite: SatelliteCreate):
     global next_satellite_id
     
     # Check if NORAD ID already exists
-    if any(s["norad_id"] == satellite.norad_id for s in satellites_db):
+    if satellite.norad_id in satellites_by_norad:
         raise HTTPException(409, "Satellite with this NORAD ID already exists")
-    
+
     new_satellite = {
         "id": next_satellite_id,
         "name": satellite.name,
@@ -844,56 +1429,68 @@ async def add_satellite(satellite: SatelliteCreate):
         "color": satellite.color,
         "is_active": True
     }
-    
+
     satellites_db.append(new_satellite)
+    satellites_by_id[new_satellite["id"]] = new_satellite
+    satellites_by_norad[new_satellite["norad_id"]] = new_satellite
+    position = generate_satellite_position(new_satellite["id"])
+    satellite_index.update(new_satellite["id"], position["latitude"], position["longitude"])
     next_satellite_id += 1
-    
+
     return new_satellite
 
 
 @app.delete("/api/satellites/{satellite_id}", tags=["Satellites"])
 async def delete_satellite(satellite_id: int):
     """Remove satellite from tracking"""
-    global satellites_db
-    
-    satellite = next((s for s in satellites_db if s["id"] == satellite_id), None)
+    satellite = satellites_by_id.pop(satellite_id, None)
     if not satellite:
         raise HTTPException(404, "Satellite not found")
-    
-    satellites_db = [s for s in satellites_db if s["id"] != satellite_id]
-    
+
+    satellites_by_norad.pop(satellite["norad_id"], None)
+    satellite_index.remove(satellite_id)
+    # Delete in place instead of rebuilding the whole list
+    for i, s in enumerate(satellites_db):
+        if s["id"] == satellite_id:
+            del satellites_db[i]
+            break
+
     return {"success": True, "message": f"Satellite {satellite['name']} removed"}
 
 
 @app.get("/api/satellites/telemetry", tags=["Satellites"])
-async def get_all_telemetry():
+async def get_all_telemetry(request: Request):
     """Get real-time telemetry for all satellites"""
+    active = [sat for sat in satellites_db if sat.get("is_active", True)]
+
+    # One vectorized propagation pass for the whole constellation
+    telemetry_list = await asyncio.to_thread(generate_constellation_telemetry, active)
+
     telemetry_data = []
-    
-    for sat in satellites_db:
-        if sat.get("is_active", True):
-            telemetry = get_satellite_telemetry(sat)
-            telemetry_data.append({
-                "satellite": sat,
-                "telemetry": telemetry
-            })
-    
-    return {
+    for sat, telemetry in zip(active, telemetry_list):
+        satellite_index.update(sat["id"], telemetry["latitude"], telemetry["longitude"])
+        telemetry_data.append({"satellite": sat, "telemetry": telemetry})
+
+    payload = {
         "telemetry": telemetry_data,
         "count": len(telemetry_data),
         "timestamp": datetime.now().isoformat()
     }
+    # Telemetry is memoized in 5s buckets, so the data is a stable ETag source
+    return conditional_response(request, payload, max_age=5,
+                                etag_source=telemetry_data)
 
 
 @app.get("/api/satellites/{satellite_id}/telemetry", tags=["Satellites"])
 async def get_satellite_telemetry_endpoint(satellite_id: int):
     """Get telemetry for specific satellite"""
-    satellite = next((s for s in satellites_db if s["id"] == satellite_id), None)
+    satellite = satellites_by_id.get(satellite_id)
     if not satellite:
         raise HTTPException(404, "Satellite not found")
     
     telemetry = get_satellite_telemetry(satellite)
-    
+    satellite_index.update(satellite["id"], telemetry["latitude"], telemetry["longitude"])
+
     return {
         "satellite": satellite,
         "telemetry": telemetry,
@@ -901,16 +1498,19 @@ async def get_satellite_telemetry_endpoint(satellite_id: int):
     }
 
 
-@app.get("/api/satellites/passes", tags=["Satellites"])
+@app.get("/api/satellites/passes", response_model=PassesResponse, tags=["Satellites"])
 async def get_all_passes(observer_lat: float = 26.0, observer_lon: float = 92.0):
     """Get pass predictions for all satellites"""
-    passes = []
-    
-    for sat in satellites_db:
-        if sat.get("is_active", True):
-            pass_info = predict_next_pass(sat, observer_lat, observer_lon)
-            passes.append(pass_info)
-    
+    # The spatial index could prefilter candidates here, but the simulated
+    # predictor is position-independent — every active satellite always
+    # produces a pass, so gating on last-known position would just drop
+    # satellites from the response. Predict for the full active set.
+    active = [sat for sat in satellites_db if sat.get("is_active", True)]
+
+    passes = list(await asyncio.gather(
+        *(asyncio.to_thread(predict_next_pass, sat, observer_lat, observer_lon) for sat in active)
+    ))
+
     # Sort by start time
     passes.sort(key=lambda x: x["start_time"])
     
@@ -922,16 +1522,13 @@ async def get_all_passes(observer_lat: float = 26.0, observer_lon: float = 92.0)
     }
 
 
-@app.get("/api/fusion/metrics", tags=["Data Fusion"])
+@app.get("/api/fusion/metrics", response_model=FusionMetricsResponse, tags=["Data Fusion"])
 async def get_fusion_metrics():
     """Get aggregated data fusion metrics"""
-    # Get telemetry for all active satellites
-    telemetry_list = []
-    for sat in satellites_db:
-        if sat.get("is_active", True):
-            telemetry = get_satellite_telemetry(sat)
-            telemetry_list.append(telemetry)
-    
+    # One vectorized propagation pass for all active satellites
+    active = [sat for sat in satellites_db if sat.get("is_active", True)]
+    telemetry_list = await asyncio.to_thread(generate_constellation_telemetry, active)
+
     metrics = calculate_fusion_metrics(telemetry_list)
     ai_insights = generate_satellite_insights(satellites_db, metrics)
     
@@ -963,14 +1560,15 @@ async def get_dataset(dataset_id: str):
 # ============================================================================
 
 @app.get("/api/disaster/summary", tags=["Disaster Monitoring"])
-async def get_disaster_summary(lat: float = 26.0, lon: float = 92.0):
+async def get_disaster_summary(request: Request, lat: float = 26.0, lon: float = 92.0):
     """
     Get comprehensive disaster monitoring summary for a location
     Includes all available warning layers and risk assessment
     """
     try:
-        summary = get_all_disaster_layers(lat, lon)
-        return summary
+        # Layers are generated concurrently and cached per lat/lon bucket
+        summary = await get_all_disaster_layers(lat, lon)
+        return conditional_response(request, summary, max_age=60)
     except Exception as e:
         raise HTTPException(500, f"Failed to generate disaster summary: {str(e)}")
 
@@ -1084,58 +1682,63 @@ async def get_landslide_risk(lat: float = 26.0, lon: float = 92.0):
 # ISRO INTEGRATION ENDPOINTS
 # ============================================================================
 
+# Static ISRO catalog, built once at import instead of per request
+ISRO_SATELLITES = [
+    {
+        "name": "CARTOSAT-3",
+        "noradId": "44804",
+        "type": "Earth Observation",
+        "resolution": "0.25m",
+        "swath": "16 km",
+        "status": "Operational"
+    },
+    {
+        "name": "RESOURCESAT-2A",
+        "noradId": "42063",
+        "type": "Resource Monitoring",
+        "resolution": "5.8m",
+        "swath": "70 km",
+        "status": "Operational"
+    },
+    {
+        "name": "RISAT-2B",
+        "noradId": "44237",
+        "type": "Radar Imaging",
+        "resolution": "1m",
+        "swath": "10 km",
+        "status": "Operational"
+    },
+    {
+        "name": "OCEANSAT-3",
+        "noradId": "54210",
+        "type": "Ocean Monitoring",
+        "resolution": "250m",
+        "swath": "1420 km",
+        "status": "Operational"
+    },
+    {
+        "name": "EOS-06",
+        "noradId": "54501",
+        "type": "Ocean Applications",
+        "resolution": "40m",
+        "swath": "740 km",
+        "status": "Operational"
+    }
+]
+
+
 @app.get("/api/isro/satellites", tags=["ISRO"])
-async def get_isro_satellites():
+async def get_isro_satellites(request: Request):
     """Get list of Indian ISRO satellites"""
-    isro_satellites = [
-        {
-            "name": "CARTOSAT-3",
-            "noradId": "44804",
-            "type": "Earth Observation",
-            "resolution": "0.25m",
-            "swath": "16 km",
-            "status": "Operational"
-        },
-        {
-            "name": "RESOURCESAT-2A",
-            "noradId": "42063",
-            "type": "Resource Monitoring",
-            "resolution": "5.8m",
-            "swath": "70 km",
-            "status": "Operational"
-        },
-        {
-            "name": "RISAT-2B",
-            "noradId": "44237",
-            "type": "Radar Imaging",
-            "resolution": "1m",
-            "swath": "10 km",
-            "status": "Operational"
-        },
-        {
-            "name": "OCEANSAT-3",
-            "noradId": "54210",
-            "type": "Ocean Monitoring",
-            "resolution": "250m",
-            "swath": "1420 km",
-            "status": "Operational"
-        },
-        {
-            "name": "EOS-06",
-            "noradId": "54501",
-            "type": "Ocean Applications",
-            "resolution": "40m",
-            "swath": "740 km",
-            "status": "Operational"
-        }
-    ]
-    
-    return {
+    payload = {
         "success": True,
-        "satellites": isro_satellites,
-        "count": len(isro_satellites),
+        "satellites": ISRO_SATELLITES,
+        "count": len(ISRO_SATELLITES),
         "timestamp": datetime.now().isoformat()
     }
+    # The catalog is static, so hash it (not the timestamp) for the ETag
+    return conditional_response(request, payload, max_age=3600,
+                                etag_source=ISRO_SATELLITES)
 
 
 @app.get("/api/isro/data/{satellite_name}", tags=["ISRO"])
@@ -1144,11 +1747,8 @@ async def get_isro_satellite_data(satellite_name: str, region: str = None):
     Get ISRO satellite data for a region
     Note: This is simulated data. Production requires MOSDAC API credentials.
     """
-    import json
-    import numpy as np
-    
     try:
-        region_data = json.loads(region) if region else {
+        region_data = orjson.loads(region) if region else {
             "name": "Delhi NCR",
             "bounds": {
                 "minLat": 28.4,
@@ -1158,33 +1758,54 @@ async def get_isro_satellite_data(satellite_name: str, region: str = None):
             }
         }
         
-        # Generate simulated data points
+        # Generate simulated data points: one meshgrid plus batched draws
+        # instead of per-point RNG calls in a nested loop
         bounds = region_data["bounds"]
         lat_range = np.linspace(bounds["minLat"], bounds["maxLat"], 20)
         lng_range = np.linspace(bounds["minLng"], bounds["maxLng"], 20)
-        
-        data_points = []
-        for lat in lat_range:
-            for lng in lng_range:
-                data_points.append({
-                    "lat": float(lat),
-                    "lng": float(lng),
-                    "value": float(np.random.uniform(0.2, 0.8)),
-                    "timestamp": datetime.now().isoformat(),
-                    "resolution": "5.8m",
-                    "band": "NIR",
-                    "cloud_cover": float(np.random.uniform(0, 30)),
-                    "quality": float(np.random.uniform(0.7, 1.0))
-                })
+
+        lat_grid, lng_grid = np.meshgrid(lat_range, lng_range, indexing="ij")
+        lats = lat_grid.ravel()
+        lngs = lng_grid.ravel()
+        n_points = lats.size
+
+        values = _rng.uniform(0.2, 0.8, n_points)
+        cloud_cover = _rng.uniform(0, 30, n_points)
+        quality = _rng.uniform(0.7, 1.0, n_points)
+        timestamp = datetime.now().isoformat()
+
+        # Statistics come from the full grid arrays; only the returned rows
+        # are materialized as dicts. tolist() converts to native floats in
+        # one C call instead of per-element float() casts
+        n_return = min(100, n_points)
+        data_points = [
+            {
+                "lat": lat,
+                "lng": lng,
+                "value": value,
+                "timestamp": timestamp,
+                "resolution": "5.8m",
+                "band": "NIR",
+                "cloud_cover": cloud,
+                "quality": qual
+            }
+            for lat, lng, value, cloud, qual in zip(
+                lats[:n_return].tolist(),
+                lngs[:n_return].tolist(),
+                values[:n_return].tolist(),
+                cloud_cover[:n_return].tolist(),
+                quality[:n_return].tolist(),
+            )
+        ]
         
         return {
             "success": True,
             "source": satellite_name,
             "region": region_data,
-            "acquisitionDate": datetime.now().isoformat(),
-            "cloudCover": np.mean([p["cloud_cover"] for p in data_points]),
-            "quality": np.mean([p["quality"] for p in data_points]),
-            "dataPoints": data_points[:100],  # Limit to 100 points
+            "acquisitionDate": timestamp,
+            "cloudCover": float(cloud_cover.mean()),
+            "quality": float(quality.mean()),
+            "dataPoints": data_points,  # Limited to 100 points
             "note": "Simulated ISRO-MOSDAC data. Production requires official API credentials."
         }
     
@@ -1205,40 +1826,53 @@ async def fuse_satellite_data(request: dict):
     try:
         datasets = request.get("datasets", ["test"])
         
-        # Generate simulated fusion data
-        import numpy as np
-        
-        fused_data = []
-        for i in range(50):
-            lat = 26.0 + (np.random.random() - 0.5) * 2
-            lng = 92.0 + (np.random.random() - 0.5) * 2
-            
-            fused_data.append({
-                "lat": float(lat),
-                "lng": float(lng),
-                "fusedValue": float(np.random.uniform(0.3, 0.9)),
-                "confidence": float(np.random.uniform(0.7, 0.99)),
-                "contributingSatellites": ["SAT-1", "SAT-2", "SAT-3"][:np.random.randint(2, 4)],
-                "sourcePoints": list(range(np.random.randint(2, 5))),
+        # Generate simulated fusion data with batched draws instead of
+        # per-point RNG calls
+        n_points = 50
+        lats = 26.0 + (_rng.random(n_points) - 0.5) * 2
+        lngs = 92.0 + (_rng.random(n_points) - 0.5) * 2
+        fused_values = _rng.uniform(0.3, 0.9, n_points)
+        confidences = _rng.uniform(0.7, 0.99, n_points)
+        sat_counts = _rng.integers(2, 4, n_points)
+        source_counts = _rng.integers(2, 5, n_points)
+        timestamp = datetime.now().isoformat()
+
+        fused_data = [
+            {
+                "lat": lat,
+                "lng": lng,
+                "fusedValue": value,
+                "confidence": conf,
+                "contributingSatellites": ["SAT-1", "SAT-2", "SAT-3"][:n_sats],
+                "sourcePoints": list(range(n_sources)),
                 "method": "weighted_average",
-                "timestamp": datetime.now().isoformat()
-            })
+                "timestamp": timestamp
+            }
+            for lat, lng, value, conf, n_sats, n_sources in zip(
+                lats.tolist(),
+                lngs.tolist(),
+                fused_values.tolist(),
+                confidences.tolist(),
+                sat_counts.tolist(),
+                source_counts.tolist(),
+            )
+        ]
         
         metrics = {
             "totalPoints": len(fused_data),
-            "avgConfidence": float(np.mean([p["confidence"] for p in fused_data])),
-            "avgSatellitesPerPoint": float(np.mean([len(p["contributingSatellites"]) for p in fused_data])),
-            "coverageImprovement": float(np.random.uniform(25, 45)),
-            "qualityImprovement": float(np.random.uniform(15, 35))
+            "avgConfidence": float(confidences.mean()),
+            "avgSatellitesPerPoint": float(sat_counts.mean()),
+            "coverageImprovement": float(_rng.uniform(25, 45)),
+            "qualityImprovement": float(_rng.uniform(15, 35))
         }
         
         return {
             "success": True,
             "fusedData": fused_data,
             "metrics": metrics,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
-    
+
     except Exception as e:
         raise HTTPException(500, f"Data fusion error: {str(e)}")
 
@@ -1285,4 +1919,15 @@ if __name__ == "__main__":
     print("=" * 80)
     
     port = int(os.getenv("BACKEND_PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # uvloop + httptools are installed via uvicorn[standard]; multiple
+    # workers require the import-string form of the app
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
@@ -2,44 +2,71 @@
 Disaster Early Warning Data Layers
 Lightweight implementation with multiple data sources
 """
+import asyncio
+
 import numpy as np
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-import random
+
+# Shared Generator RNG: bulk draws are far cheaper than per-field calls
+# into the legacy random module
+_rng = np.random.default_rng()
+
+# Categorical vocabularies as arrays so one integers() draw plus fancy
+# indexing assigns a whole batch at once
+_RISK_LEVELS = np.array(["LOW", "MEDIUM", "HIGH"])
+_TRENDS = np.array(["stable", "rising", "falling"])
+_SATS = np.array(["VIIRS", "MODIS", "Sentinel-3"])
+_EVENT_TYPES = np.array(["earthquake", "tremor", "aftershock"])
+_CATEGORIES = np.array(["Tropical Depression", "Tropical Storm",
+                        "Category 1", "Category 2", "Category 3"])
+_DIRECTIONS = np.array(["NE", "NW", "SE", "SW", "N", "S", "E", "W"])
 
 def generate_weather_alerts(lat: float, lon: float, radius: float = 2.0) -> Dict[str, Any]:
     """Generate weather-based alerts (precipitation, storms)"""
-    
+
     # Simulate weather patterns
-    num_alerts = random.randint(0, 3)
+    num_alerts = int(_rng.integers(0, 4))
     alerts = []
-    
+
     weather_types = [
         {"type": "Heavy Rainfall", "severity": "HIGH", "icon": "cloud-rain"},
         {"type": "Thunderstorm", "severity": "MEDIUM", "icon": "cloud-lightning"},
         {"type": "Strong Winds", "severity": "MEDIUM", "icon": "wind"},
         {"type": "Hail Risk", "severity": "LOW", "icon": "cloud-hail"}
     ]
-    
+
+    # Batched draws for every alert at once
+    type_idx = _rng.integers(0, len(weather_types), num_alerts)
+    offsets = (_rng.random((num_alerts, 2)) - 0.5) * radius
+    radii = _rng.uniform(5, 25, num_alerts)
+    confidences = _rng.integers(70, 96, num_alerts)
+    hours_ago = _rng.integers(0, 7, num_alerts)
+    durations = _rng.integers(2, 13, num_alerts)
+
+    _now = datetime.now()
+    _tag = _now.strftime('%Y%m%d')
+    # One vectorized datetime64 pass instead of per-alert isoformat calls
+    timestamps = (np.datetime64(_now) - hours_ago.astype('timedelta64[h]')).astype(str).tolist()
+
     for i in range(num_alerts):
-        weather = random.choice(weather_types)
-        offset_lat = (random.random() - 0.5) * radius
-        offset_lon = (random.random() - 0.5) * radius
-        
+        weather = weather_types[type_idx[i]]
+
         alerts.append({
-            "id": f"WEATHER-{datetime.now().strftime('%Y%m%d')}-{i:03d}",
+            "id": f"WEATHER-{_tag}-{i:03d}",
             "type": weather["type"],
             "severity": weather["severity"],
             "icon": weather["icon"],
-            "latitude": lat + offset_lat,
-            "longitude": lon + offset_lon,
-            "radius_km": random.uniform(5, 25),
-            "confidence": random.randint(70, 95),
-            "timestamp": (datetime.now() - timedelta(hours=random.randint(0, 6))).isoformat(),
+            "latitude": lat + offsets[i, 0],
+            "longitude": lon + offsets[i, 1],
+            "radius_km": float(radii[i]),
+            "confidence": int(confidences[i]),
+            "timestamp": timestamps[i],
             "description": f"{weather['type']} detected in the region. Monitor conditions closely.",
-            "expected_duration_hours": random.randint(2, 12)
+            "expected_duration_hours": int(durations[i])
         })
-    
+
     return {
         "alerts": alerts,
         "count": len(alerts),
@@ -51,16 +78,24 @@ def generate_flood_risk_zones(lat: float, lon: float, grid_size: int = 30) -> Di
     """Generate flood risk zones based on terrain and water proximity"""
     
     features = []
-    
-    # Generate risk zones
-    num_zones = random.randint(2, 5)
-    
+
+    # Generate risk zones with batched draws
+    num_zones = int(_rng.integers(2, 6))
+
+    centers = (_rng.random((num_zones, 2)) - 0.5) * 1.5
+    sizes = _rng.uniform(0.1, 0.3, num_zones)
+    levels = _RISK_LEVELS[_rng.integers(0, len(_RISK_LEVELS), num_zones)].tolist()
+    populations = _rng.integers(500, 5001, num_zones)
+    trends = _TRENDS[_rng.integers(0, len(_TRENDS), num_zones)].tolist()
+
+    _iso = datetime.now().isoformat()
+
     for i in range(num_zones):
         # Create a small polygon for each risk zone
-        center_lat = lat + (random.random() - 0.5) * 1.5
-        center_lon = lon + (random.random() - 0.5) * 1.5
-        size = random.uniform(0.1, 0.3)
-        
+        center_lat = lat + centers[i, 0]
+        center_lon = lon + centers[i, 1]
+        size = sizes[i]
+
         polygon = [
             [center_lon - size, center_lat - size],
             [center_lon + size, center_lat - size],
@@ -68,10 +103,7 @@ def generate_flood_risk_zones(lat: float, lon: float, grid_size: int = 30) -> Di
             [center_lon - size, center_lat + size],
             [center_lon - size, center_lat - size]
         ]
-        
-        risk_levels = ["LOW", "MEDIUM", "HIGH"]
-        risk_level = random.choice(risk_levels)
-        
+
         features.append({
             "type": "Feature",
             "geometry": {
@@ -79,11 +111,11 @@ def generate_flood_risk_zones(lat: float, lon: float, grid_size: int = 30) -> Di
                 "coordinates": [polygon]
             },
             "properties": {
-                "risk_level": risk_level,
+                "risk_level": levels[i],
                 "zone_id": f"FLOOD-{i:03d}",
-                "population_at_risk": random.randint(500, 5000),
-                "water_level_trend": random.choice(["stable", "rising", "falling"]),
-                "last_updated": datetime.now().isoformat()
+                "population_at_risk": int(populations[i]),
+                "water_level_trend": trends[i],
+                "last_updated": _iso
             }
         })
     
@@ -100,29 +132,35 @@ def generate_flood_risk_zones(lat: float, lon: float, grid_size: int = 30) -> Di
 def generate_fire_hotspots(lat: float, lon: float, days: int = 1) -> Dict[str, Any]:
     """Generate fire hotspot data"""
     
-    num_hotspots = random.randint(0, 8)
+    num_hotspots = int(_rng.integers(0, 9))
     hotspots = []
-    
+
+    offsets = (_rng.random((num_hotspots, 2)) - 0.5) * 2.0
+    confidences = _rng.integers(60, 101, num_hotspots)
+    brightness = _rng.uniform(300, 380, num_hotspots)
+    hours_ago = _rng.integers(0, 24*days + 1, num_hotspots)
+    sats = _SATS[_rng.integers(0, len(_SATS), num_hotspots)].tolist()
+    areas = _rng.uniform(0.1, 2.5, num_hotspots)
+
+    _now = datetime.now()
+    _tag = _now.strftime('%Y%m%d')
+    detection_times = (np.datetime64(_now) - hours_ago.astype('timedelta64[h]')).astype(str).tolist()
+
     for i in range(num_hotspots):
-        offset_lat = (random.random() - 0.5) * 2.0
-        offset_lon = (random.random() - 0.5) * 2.0
-        
-        confidence = random.randint(60, 100)
-        brightness = random.uniform(300, 380)
-        
         # High brightness = active fire
-        severity = "HIGH" if brightness > 350 else "MEDIUM" if brightness > 320 else "LOW"
-        
+        b = float(brightness[i])
+        severity = "HIGH" if b > 350 else "MEDIUM" if b > 320 else "LOW"
+
         hotspots.append({
-            "id": f"FIRE-{datetime.now().strftime('%Y%m%d')}-{i:03d}",
-            "latitude": lat + offset_lat,
-            "longitude": lon + offset_lon,
-            "brightness_kelvin": brightness,
-            "confidence": confidence,
+            "id": f"FIRE-{_tag}-{i:03d}",
+            "latitude": lat + offsets[i, 0],
+            "longitude": lon + offsets[i, 1],
+            "brightness_kelvin": b,
+            "confidence": int(confidences[i]),
             "severity": severity,
-            "detection_time": (datetime.now() - timedelta(hours=random.randint(0, 24*days))).isoformat(),
-            "satellite": random.choice(["VIIRS", "MODIS", "Sentinel-3"]),
-            "area_km2": random.uniform(0.1, 2.5)
+            "detection_time": detection_times[i],
+            "satellite": sats[i],
+            "area_km2": float(areas[i])
         })
     
     return {
@@ -136,16 +174,26 @@ def generate_fire_hotspots(lat: float, lon: float, days: int = 1) -> Dict[str, A
 def generate_seismic_activity(lat: float, lon: float, days: int = 7) -> Dict[str, Any]:
     """Generate earthquake/seismic activity data"""
     
-    num_events = random.randint(0, 5)
+    num_events = int(_rng.integers(0, 6))
     events = []
-    
+
+    offsets = (_rng.random((num_events, 2)) - 0.5) * 3.0
+    magnitudes = _rng.uniform(2.0, 6.5, num_events)
+    # Round whole batches up front instead of one round() call per field
+    rounded_mags = np.round(magnitudes, 1).tolist()
+    depths = np.round(_rng.uniform(5, 50, num_events), 1).tolist()
+    days_ago = _rng.random(num_events) * days
+    types = _EVENT_TYPES[_rng.integers(0, len(_EVENT_TYPES), num_events)].tolist()
+    felt = _rng.integers(0, 201, num_events)
+
+    _now = datetime.now()
+    _tag = _now.strftime('%Y%m%d')
+    timestamps = (np.datetime64(_now)
+                  - (days_ago * 86_400_000_000).astype('timedelta64[us]')).astype(str).tolist()
+
     for i in range(num_events):
-        offset_lat = (random.random() - 0.5) * 3.0
-        offset_lon = (random.random() - 0.5) * 3.0
-        
-        magnitude = random.uniform(2.0, 6.5)
-        depth_km = random.uniform(5, 50)
-        
+        magnitude = float(magnitudes[i])
+
         # Determine severity based on magnitude
         if magnitude >= 6.0:
             severity = "HIGH"
@@ -153,17 +201,17 @@ def generate_seismic_activity(lat: float, lon: float, days: int = 7) -> Dict[str
             severity = "MEDIUM"
         else:
             severity = "LOW"
-        
+
         events.append({
-            "id": f"SEISMIC-{datetime.now().strftime('%Y%m%d')}-{i:03d}",
-            "latitude": lat + offset_lat,
-            "longitude": lon + offset_lon,
-            "magnitude": round(magnitude, 1),
-            "depth_km": round(depth_km, 1),
+            "id": f"SEISMIC-{_tag}-{i:03d}",
+            "latitude": lat + offsets[i, 0],
+            "longitude": lon + offsets[i, 1],
+            "magnitude": rounded_mags[i],
+            "depth_km": depths[i],
             "severity": severity,
-            "timestamp": (datetime.now() - timedelta(days=random.random() * days)).isoformat(),
-            "type": random.choice(["earthquake", "tremor", "aftershock"]),
-            "felt_reports": random.randint(0, 200) if magnitude > 3.5 else 0
+            "timestamp": timestamps[i],
+            "type": types[i],
+            "felt_reports": int(felt[i]) if magnitude > 3.5 else 0
         })
     
     # Sort by time (most recent first)
@@ -181,15 +229,23 @@ def generate_drought_indicators(lat: float, lon: float, grid_size: int = 40) ->
     """Generate drought risk indicators based on vegetation health"""
     
     features = []
-    
-    # Create grid of vegetation health zones
-    num_zones = random.randint(3, 6)
-    
+
+    # Create grid of vegetation health zones with batched draws
+    num_zones = int(_rng.integers(3, 7))
+
+    centers = (_rng.random((num_zones, 2)) - 0.5) * 1.0
+    sizes = _rng.uniform(0.15, 0.25, num_zones)
+    ndvi_values = _rng.uniform(0.1, 0.7, num_zones)
+    rounded_ndvi = np.round(ndvi_values, 2).tolist()
+    soil_moisture = _rng.integers(10, 61, num_zones)
+    deficits = _rng.integers(0, 151, num_zones)
+    last_rain = _rng.integers(0, 61, num_zones)
+
     for i in range(num_zones):
-        center_lat = lat + (random.random() - 0.5) * 1.0
-        center_lon = lon + (random.random() - 0.5) * 1.0
-        size = random.uniform(0.15, 0.25)
-        
+        center_lat = lat + centers[i, 0]
+        center_lon = lon + centers[i, 1]
+        size = sizes[i]
+
         polygon = [
             [center_lon - size, center_lat - size],
             [center_lon + size, center_lat - size],
@@ -197,10 +253,10 @@ def generate_drought_indicators(lat: float, lon: float, grid_size: int = 40) ->
             [center_lon - size, center_lat + size],
             [center_lon - size, center_lat - size]
         ]
-        
+
         # NDVI values: <0.2 = stressed, 0.2-0.4 = moderate, >0.4 = healthy
-        ndvi = random.uniform(0.1, 0.7)
-        
+        ndvi = float(ndvi_values[i])
+
         if ndvi < 0.2:
             risk_level = "HIGH"
             status = "Severe Stress"
@@ -219,12 +275,12 @@ def generate_drought_indicators(lat: float, lon: float, grid_size: int = 40) ->
             },
             "properties": {
                 "zone_id": f"DROUGHT-{i:03d}",
-                "ndvi": round(ndvi, 2),
+                "ndvi": rounded_ndvi[i],
                 "risk_level": risk_level,
                 "status": status,
-                "soil_moisture_percent": random.randint(10, 60),
-                "precipitation_deficit_mm": random.randint(0, 150),
-                "last_rainfall_days": random.randint(0, 60)
+                "soil_moisture_percent": int(soil_moisture[i]),
+                "precipitation_deficit_mm": int(deficits[i]),
+                "last_rainfall_days": int(last_rain[i])
             }
         })
     
@@ -243,36 +299,45 @@ def generate_cyclone_tracks(lat: float, lon: float) -> Dict[str, Any]:
     """Generate cyclone/hurricane tracking data"""
     
     # Simulate 0-2 active cyclones
-    num_cyclones = random.randint(0, 2)
+    num_cyclones = int(_rng.integers(0, 3))
     cyclones = []
-    
-    categories = ["Tropical Depression", "Tropical Storm", "Category 1", "Category 2", "Category 3"]
-    
+
+    _now = datetime.now()
+    _year = _now.strftime('%Y')
+
     for i in range(num_cyclones):
-        # Generate a track (past positions)
-        num_points = random.randint(5, 12)
-        track_points = []
-        
-        current_lat = lat + (random.random() - 0.5) * 5.0
-        current_lon = lon + (random.random() - 0.5) * 5.0
-        
-        for j in range(num_points):
-            track_points.append({
-                "latitude": current_lat,
-                "longitude": current_lon,
-                "timestamp": (datetime.now() - timedelta(hours=(num_points - j) * 6)).isoformat(),
-                "wind_speed_kmh": random.randint(80, 200),
-                "pressure_mb": random.randint(950, 1000)
-            })
-            # Move the cyclone
-            current_lat += (random.random() - 0.5) * 0.5
-            current_lon += (random.random() - 0.3) * 0.8
-        
+        # Generate a track (past positions) via one cumulative-sum walk
+        # instead of a per-step Python loop
+        num_points = int(_rng.integers(5, 13))
+
+        lat_steps = (_rng.random(num_points) - 0.5) * 0.5
+        lon_steps = (_rng.random(num_points) - 0.3) * 0.8
+        # First step places the cyclone near the query point
+        lat_steps[0] = (_rng.random() - 0.5) * 5.0
+        lon_steps[0] = (_rng.random() - 0.5) * 5.0
+        track_lats = (lat + np.cumsum(lat_steps)).tolist()
+        track_lons = (lon + np.cumsum(lon_steps)).tolist()
+
+        winds = _rng.integers(80, 201, num_points).tolist()
+        pressures = _rng.integers(950, 1001, num_points).tolist()
+
+        track_points = [
+            {
+                "latitude": track_lat,
+                "longitude": track_lon,
+                "timestamp": (_now - timedelta(hours=(num_points - j) * 6)).isoformat(),
+                "wind_speed_kmh": wind,
+                "pressure_mb": pressure
+            }
+            for j, (track_lat, track_lon, wind, pressure) in enumerate(
+                zip(track_lats, track_lons, winds, pressures))
+        ]
+
         latest = track_points[-1]
-        category = random.choice(categories)
-        
+        category = str(_CATEGORIES[_rng.integers(0, len(_CATEGORIES))])
+
         cyclones.append({
-            "id": f"CYCLONE-{datetime.now().strftime('%Y')}-{chr(65+i)}",
+            "id": f"CYCLONE-{_year}-{chr(65+i)}",
             "name": f"Storm {chr(65+i)}",
             "category": category,
             "severity": "HIGH" if "Category" in category else "MEDIUM",
@@ -282,10 +347,10 @@ def generate_cyclone_tracks(lat: float, lon: float) -> Dict[str, Any]:
             },
             "wind_speed_kmh": latest["wind_speed_kmh"],
             "pressure_mb": latest["pressure_mb"],
-            "movement_direction": random.choice(["NE", "NW", "SE", "SW", "N", "S", "E", "W"]),
-            "movement_speed_kmh": random.randint(15, 45),
+            "movement_direction": str(_DIRECTIONS[_rng.integers(0, len(_DIRECTIONS))]),
+            "movement_speed_kmh": int(_rng.integers(15, 46)),
             "track": track_points,
-            "affected_area_km2": random.randint(5000, 50000)
+            "affected_area_km2": int(_rng.integers(5000, 50001))
         })
     
     return {
@@ -299,13 +364,27 @@ def generate_landslide_risk(lat: float, lon: float) -> Dict[str, Any]:
     """Generate landslide risk zones"""
     
     features = []
-    num_zones = random.randint(1, 4)
-    
+    num_zones = int(_rng.integers(1, 5))
+
+    centers = (_rng.random((num_zones, 2)) - 0.5) * 1.2
+    sizes = _rng.uniform(0.08, 0.18, num_zones)
+    slopes = _rng.uniform(15, 50, num_zones)
+    saturations = _rng.uniform(30, 95, num_zones)
+    rainfalls = _rng.integers(20, 201, num_zones)
+    vegetation = _rng.integers(10, 81, num_zones)
+
+    # Risk calculation based on slope and saturation, scored and rounded
+    # as whole batches instead of per-zone round() calls
+    risk_scores = (slopes / 50) * 50 + (saturations / 100) * 50
+    rounded_scores = np.round(risk_scores, 1).tolist()
+    rounded_slopes = np.round(slopes, 1).tolist()
+    rounded_saturations = np.round(saturations, 1).tolist()
+
     for i in range(num_zones):
-        center_lat = lat + (random.random() - 0.5) * 1.2
-        center_lon = lon + (random.random() - 0.5) * 1.2
-        size = random.uniform(0.08, 0.18)
-        
+        center_lat = lat + centers[i, 0]
+        center_lon = lon + centers[i, 1]
+        size = sizes[i]
+
         polygon = [
             [center_lon - size, center_lat - size],
             [center_lon + size, center_lat - size],
@@ -313,13 +392,9 @@ def generate_landslide_risk(lat: float, lon: float) -> Dict[str, Any]:
             [center_lon - size, center_lat + size],
             [center_lon - size, center_lat - size]
         ]
-        
-        slope_angle = random.uniform(15, 50)
-        soil_saturation = random.uniform(30, 95)
-        
-        # Risk calculation based on slope and saturation
-        risk_score = (slope_angle / 50) * 50 + (soil_saturation / 100) * 50
-        
+
+        risk_score = float(risk_scores[i])
+
         if risk_score > 70:
             risk_level = "HIGH"
         elif risk_score > 45:
@@ -336,11 +411,11 @@ def generate_landslide_risk(lat: float, lon: float) -> Dict[str, Any]:
             "properties": {
                 "zone_id": f"LANDSLIDE-{i:03d}",
                 "risk_level": risk_level,
-                "risk_score": round(risk_score, 1),
-                "slope_angle_degrees": round(slope_angle, 1),
-                "soil_saturation_percent": round(soil_saturation, 1),
-                "recent_rainfall_mm": random.randint(20, 200),
-                "vegetation_cover_percent": random.randint(10, 80)
+                "risk_score": rounded_scores[i],
+                "slope_angle_degrees": rounded_slopes[i],
+                "soil_saturation_percent": rounded_saturations[i],
+                "recent_rainfall_mm": int(rainfalls[i]),
+                "vegetation_cover_percent": int(vegetation[i])
             }
         })
     
@@ -354,17 +429,42 @@ def generate_landslide_risk(lat: float, lon: float) -> Dict[str, Any]:
     }
 
 
-def get_all_disaster_layers(lat: float, lon: float) -> Dict[str, Any]:
-    """Get summary of all disaster warning layers"""
-    
-    weather = generate_weather_alerts(lat, lon)
-    flood = generate_flood_risk_zones(lat, lon)
-    fire = generate_fire_hotspots(lat, lon)
-    seismic = generate_seismic_activity(lat, lon)
-    drought = generate_drought_indicators(lat, lon)
-    cyclone = generate_cyclone_tracks(lat, lon)
-    landslide = generate_landslide_risk(lat, lon)
-    
+# Map pans re-query near-identical coordinates; short TTL buckets keyed on
+# rounded lat/lon skip regenerating all seven layers
+_SUMMARY_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+
+async def get_all_disaster_layers(lat: float, lon: float) -> Dict[str, Any]:
+    """Get summary of all disaster warning layers, generated concurrently"""
+
+    cache_key = (round(lat, 2), round(lon, 2))
+    cached = _SUMMARY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    weather, flood, fire, seismic, drought, cyclone, landslide = await asyncio.gather(
+        asyncio.to_thread(generate_weather_alerts, lat, lon),
+        asyncio.to_thread(generate_flood_risk_zones, lat, lon),
+        asyncio.to_thread(generate_fire_hotspots, lat, lon),
+        asyncio.to_thread(generate_seismic_activity, lat, lon),
+        asyncio.to_thread(generate_drought_indicators, lat, lon),
+        asyncio.to_thread(generate_cyclone_tracks, lat, lon),
+        asyncio.to_thread(generate_landslide_risk, lat, lon),
+    )
+
+    summary = summarize_disaster_layers(lat, lon, weather, flood, fire,
+                                        seismic, drought, cyclone, landslide)
+    _SUMMARY_CACHE[cache_key] = summary
+    return summary
+
+
+def summarize_disaster_layers(lat: float, lon: float,
+                              weather: Dict[str, Any], flood: Dict[str, Any],
+                              fire: Dict[str, Any], seismic: Dict[str, Any],
+                              drought: Dict[str, Any], cyclone: Dict[str, Any],
+                              landslide: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregate already-generated layers into the summary payload"""
+
     # Count total alerts
     total_alerts = (
         weather["count"] +
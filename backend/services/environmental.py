@@ -3,57 +3,104 @@ Environmental analysis service - NDWI, DEM, and risk detection algorithms
 Merged from jaymit copy project
 """
 import numpy as np
+from functools import lru_cache
 from typing import Tuple
+from scipy import ndimage as ndi
 from scipy.ndimage import maximum_filter
-from skimage import measure
-from shapely.geometry import Polygon, mapping
+
+# 8-connectivity structure matching skimage's connectivity=2
+_EIGHT_CONNECTED = np.ones((3, 3), dtype=np.int8)
+
+# Gaussian bump centers for the synthetic scene as (row, col) pairs
+_MOUNTAIN_REGIONS = np.array([(10, 10), (40, 40), (25, 35)], dtype=np.float64)
+_MONSOON_CENTERS = np.array([(15, 20), (35, 40), (25, 30)], dtype=np.float64)
+
+
+# Tile edge for cache-blocked Gaussian accumulation on large grids
+_GAUSS_TILE = 128
+
+
+def _add_gaussian_bumps(out: np.ndarray, xx: np.ndarray, yy: np.ndarray,
+                        centers: np.ndarray, amplitude: float, scale: float) -> np.ndarray:
+    """
+    Accumulate Gaussian bumps into out in place.
+
+    Small grids use one stacked (K, H, W) broadcast; large grids are
+    processed tile by tile so the temporaries stay cache-resident instead
+    of allocating K full-grid intermediates.
+    """
+    n = out.shape[0]
+
+    if n <= 4 * _GAUSS_TILE:
+        dx = xx[None] - centers[:, 1, None, None]
+        dy = yy[None] - centers[:, 0, None, None]
+        out += (amplitude * np.exp(-np.sqrt(dx*dx + dy*dy) / scale)).sum(axis=0)
+        return out
+
+    for y0 in range(0, n, _GAUSS_TILE):
+        for x0 in range(0, n, _GAUSS_TILE):
+            y1, x1 = y0 + _GAUSS_TILE, x0 + _GAUSS_TILE
+            dx = xx[y0:y1, x0:x1][None] - centers[:, 1, None, None]
+            dy = yy[y0:y1, x0:x1][None] - centers[:, 0, None, None]
+            out[y0:y1, x0:x1] += (amplitude * np.exp(-np.sqrt(dx*dx + dy*dy) / scale)).sum(axis=0)
+    return out
+
+
+@lru_cache(maxsize=8)
+def _grid(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Shared read-only meshgrid for an n x n scene"""
+    x = np.linspace(0, n - 1, n)
+    xx, yy = np.meshgrid(x, x)
+    xx.setflags(write=False)
+    yy.setflags(write=False)
+    return xx, yy
+
+# Try to import numba for a JIT-compiled risk kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 def generate_synthetic_satellite_data(lat_center: float = 26.0,
                                       lon_center: float = 92.0,
                                       grid_size: int = 50) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Generate synthetic satellite data for demo purposes"""
-    np.random.seed(42)
-    
-    x = np.linspace(0, grid_size-1, grid_size)
-    y = np.linspace(0, grid_size-1, grid_size)
-    xx, yy = np.meshgrid(x, y)
-    
+    rng = np.random.default_rng(42)
+
+    xx, yy = _grid(grid_size)
+    river_dist = np.abs(yy - xx * 0.8)
+
     # OLD NDWI (Past water conditions)
-    river_mask_old = np.abs(yy - xx * 0.8) < 5
-    old_ndwi = np.random.uniform(-0.3, 0.2, (grid_size, grid_size))
-    old_ndwi[river_mask_old] = np.random.uniform(0.3, 0.6, np.sum(river_mask_old))
-    
+    river_mask_old = river_dist < 5
+    old_ndwi = rng.uniform(-0.3, 0.2, (grid_size, grid_size))
+    old_ndwi[river_mask_old] = rng.uniform(0.3, 0.6, int(river_mask_old.sum()))
+
     # NEW NDWI (Current water conditions - expanded)
     new_ndwi = old_ndwi.copy()
-    river_mask_new = np.abs(yy - xx * 0.8) < 8
-    new_ndwi[river_mask_new] = np.random.uniform(0.35, 0.7, np.sum(river_mask_new))
-    
-    # Add water patches (flood simulation)
-    for _ in range(3):
-        cx, cy = np.random.randint(10, grid_size-10, 2)
-        dist = np.sqrt((xx - cx)**2 + (yy - cy)**2)
-        water_patch = dist < 4
-        new_ndwi[water_patch] = np.random.uniform(0.4, 0.7, np.sum(water_patch))
-    
+    river_mask_new = river_dist < 8
+    new_ndwi[river_mask_new] = rng.uniform(0.35, 0.7, int(river_mask_new.sum()))
+
+    # Add water patches (flood simulation): one stacked mask for all patches
+    patch_centers = rng.integers(10, grid_size-10, (3, 2))
+    dx = xx[None] - patch_centers[:, 0, None, None]
+    dy = yy[None] - patch_centers[:, 1, None, None]
+    water_patch = (dx*dx + dy*dy < 16).any(axis=0)
+    new_ndwi[water_patch] = rng.uniform(0.4, 0.7, int(water_patch.sum()))
+
     # DEM (Digital Elevation Model)
-    dem = 100 + 50 * (np.abs(yy - xx * 0.8) / 10)
-    dem += np.random.uniform(-5, 5, (grid_size, grid_size))
-    
-    # Add mountainous regions
-    mountain_regions = [(10, 10), (40, 40), (25, 35)]
-    for my, mx in mountain_regions:
-        dist = np.sqrt((xx - mx)**2 + (yy - my)**2)
-        dem += 80 * np.exp(-dist / 8)
-    
+    dem = 100 + 50 * (river_dist / 10)
+    dem += rng.uniform(-5, 5, (grid_size, grid_size))
+
+    # Add mountainous regions, tiled on large grids
+    _add_gaussian_bumps(dem, xx, yy, _MOUNTAIN_REGIONS, 80, 8)
+
     # RAINFALL
-    rainfall = np.random.uniform(50, 150, (grid_size, grid_size))
-    monsoon_centers = [(15, 20), (35, 40), (25, 30)]
-    for cy, cx in monsoon_centers:
-        dist = np.sqrt((xx - cx)**2 + (yy - cy)**2)
-        rainfall += 100 * np.exp(-dist / 5)
+    rainfall = rng.uniform(50, 150, (grid_size, grid_size))
+    _add_gaussian_bumps(rainfall, xx, yy, _MONSOON_CENTERS, 100, 5)
     rainfall = np.clip(rainfall, 0, 500)
-    
+
     return old_ndwi, new_ndwi, dem, rainfall
 
 
@@ -66,103 +113,166 @@ def detect_water_change(old_ndwi: np.ndarray, new_ndwi: np.ndarray, threshold: f
 
 def calculate_slope_factor(dem: np.ndarray, cell_size: float = 30.0) -> np.ndarray:
     """Calculate slope risk factor from DEM"""
-    grad_y, grad_x = np.gradient(dem, cell_size)
-    slope_radians = np.arctan(np.sqrt(grad_x**2 + grad_y**2))
-    slope_degrees = np.degrees(slope_radians)
-    
-    slope_factor = np.zeros_like(slope_degrees)
-    mask = slope_degrees <= 5
-    slope_factor[mask] = slope_degrees[mask]
-    mask = (slope_degrees > 5) & (slope_degrees <= 15)
-    slope_factor[mask] = 5 + (slope_degrees[mask] - 5)
-    mask = (slope_degrees > 15) & (slope_degrees <= 30)
-    slope_factor[mask] = 15 + ((slope_degrees[mask] - 15) * 0.67)
-    slope_factor[slope_degrees > 30] = 25
+    # Sobel gradients in one C pass each; the 8x kernel weight normalizes
+    # back to elevation units per cell
+    grad_y = ndi.sobel(dem, axis=0, mode='nearest') / (8 * cell_size)
+    grad_x = ndi.sobel(dem, axis=1, mode='nearest') / (8 * cell_size)
+    slope_radians = np.arctan(np.hypot(grad_x, grad_y))
+    # float32 is plenty for risk factors and halves memory traffic
+    slope_degrees = np.degrees(slope_radians).astype(np.float32)
     
+    # One piecewise pass instead of four mask materializations
+    slope_factor = np.piecewise(
+        slope_degrees,
+        [slope_degrees <= 5,
+         (slope_degrees > 5) & (slope_degrees <= 15),
+         (slope_degrees > 15) & (slope_degrees <= 30)],
+        [lambda s: s,
+         lambda s: 5 + (s - 5),
+         lambda s: 15 + (s - 15) * 0.67,
+         25]
+    )
+
     return slope_factor
 
 
 def calculate_rainfall_factor(rainfall: np.ndarray) -> np.ndarray:
     """Convert rainfall to risk factor"""
-    rainfall_factor = np.zeros_like(rainfall)
-    
-    mask = rainfall <= 50
-    rainfall_factor[mask] = (rainfall[mask] / 50) * 3
-    mask = (rainfall > 50) & (rainfall <= 150)
-    rainfall_factor[mask] = 3 + ((rainfall[mask] - 50) / 100) * 5
-    mask = (rainfall > 150) & (rainfall <= 300)
-    rainfall_factor[mask] = 8 + ((rainfall[mask] - 150) / 150) * 4
-    mask = rainfall > 300
-    rainfall_factor[mask] = np.minimum(12 + (rainfall[mask] - 300) / 100, 15)
-    
+    rainfall = np.asarray(rainfall, dtype=np.float32)
+
+    # One piecewise pass instead of four mask materializations
+    rainfall_factor = np.piecewise(
+        rainfall,
+        [rainfall <= 50,
+         (rainfall > 50) & (rainfall <= 150),
+         (rainfall > 150) & (rainfall <= 300)],
+        [lambda r: (r / 50) * 3,
+         lambda r: 3 + ((r - 50) / 100) * 5,
+         lambda r: 8 + ((r - 150) / 150) * 4,
+         lambda r: np.minimum(12 + (r - 300) / 100, 15)]
+    )
+
     return np.clip(rainfall_factor, 0, 15)
 
 
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the parallel threading layer can deadlock at
+    # interpreter exit when first initialized off the main thread (the
+    # risk endpoints call this via asyncio.to_thread), and the grids are
+    # at most 100x100 so fan-out would not pay anyway
+    @njit(cache=True)
+    def _risk_kernel(water_change, slope_factor, rainfall_factor):
+        """Fused base score + 3x3 proximity bonus in one streaming pass"""
+        h, w = water_change.shape
+        out = np.zeros((h, w), dtype=np.float32)
+        for y in range(h):
+            y0 = y - 1 if y > 0 else 0
+            y1 = y + 2 if y + 2 <= h else h
+            for x in range(w):
+                if water_change[y, x]:
+                    score = 50.0 + slope_factor[y, x] + rainfall_factor[y, x]
+                else:
+                    # Proximity bonus for dry cells touching water
+                    x0 = x - 1 if x > 0 else 0
+                    x1 = x + 2 if x + 2 <= w else w
+                    score = 0.0
+                    for ny in range(y0, y1):
+                        for nx in range(x0, x1):
+                            if water_change[ny, nx]:
+                                score = 10.0
+                                break
+                        if score > 0.0:
+                            break
+                if score > 100.0:
+                    score = 100.0
+                out[y, x] = score
+        return out
+
+
 def calculate_risk_score(water_change: np.ndarray, slope_factor: np.ndarray, rainfall_factor: np.ndarray) -> np.ndarray:
     """Combine factors into unified risk score"""
-    risk_score = np.zeros_like(water_change, dtype=float)
+    if NUMBA_AVAILABLE:
+        return _risk_kernel(np.ascontiguousarray(water_change),
+                            np.ascontiguousarray(slope_factor),
+                            np.ascontiguousarray(rainfall_factor))
+
+    risk_score = np.zeros(water_change.shape, dtype=np.float32)
     risk_score[water_change] = 50
     risk_score[water_change] += slope_factor[water_change]
     risk_score[water_change] += rainfall_factor[water_change]
-    
-    proximity = maximum_filter(water_change.astype(float), size=3)
-    proximity_bonus = (proximity - water_change.astype(float)) * 10
+
+    # uint8 gets a faster typed scipy filter path than float64
+    water_u8 = water_change.astype(np.uint8)
+    proximity = maximum_filter(water_u8, size=3)
+    proximity_bonus = (proximity - water_u8).astype(np.float32) * 10
     risk_score += proximity_bonus
-    
+
     return np.clip(risk_score, 0, 100)
 
 
 def generate_risk_geojson(risk_score: np.ndarray, lat_center: float = 26.0, lon_center: float = 92.0) -> dict:
     """Convert risk score grid to GeoJSON polygons"""
     features = []
-    
-    risk_levels = [
-        (80, 100, "HIGH", "#ef4444"),
-        (60, 80, "MEDIUM", "#f97316"),
-        (40, 60, "LOW", "#fbbf24")
+
+    # Band map in one digitize pass: 1=LOW, 2=MEDIUM, 3=HIGH
+    band_map = np.digitize(risk_score, [40, 60, 80, 100])
+    risk_bands = [
+        (3, "HIGH", "#ef4444"),
+        (2, "MEDIUM", "#f97316"),
+        (1, "LOW", "#fbbf24")
     ]
-    
-    grid_size = risk_score.shape[0]
+
     km_per_pixel = 1.0
     deg_per_pixel = km_per_pixel / 111.0
-    
-    for min_risk, max_risk, level, color in risk_levels:
-        mask = (risk_score >= min_risk) & (risk_score < max_risk)
-        
+
+    for band, level, color in risk_bands:
+        mask = band_map == band
+
         if not mask.any():
             continue
-        
-        labeled = measure.label(mask, connectivity=2)
-        regions = measure.regionprops(labeled)
-        
-        for region in regions:
-            if region.area < 3:
+
+        labeled, n_regions = ndi.label(mask, structure=_EIGHT_CONNECTED)
+        # Per-region means vectorized in C instead of a full-grid boolean
+        # scan per region
+        mean_risks = ndi.mean(risk_score, labels=labeled,
+                              index=np.arange(1, n_regions + 1))
+        # Areas and bounding boxes straight from the label array; no
+        # regionprops object per region
+        areas = np.bincount(labeled.ravel())[1:]
+        bboxes = ndi.find_objects(labeled)
+
+        for area, slices, avg_risk in zip(areas.tolist(), bboxes, mean_risks):
+            if area < 3:
                 continue
-            
-            minr, minc, maxr, maxc = region.bbox
-            
+
+            minr, maxr = slices[0].start, slices[0].stop
+            minc, maxc = slices[1].start, slices[1].stop
+
             lat_max = lat_center - (minr * deg_per_pixel)
             lat_min = lat_center - (maxr * deg_per_pixel)
             lon_min = lon_center + (minc * deg_per_pixel)
             lon_max = lon_center + (maxc * deg_per_pixel)
-            
-            polygon = Polygon([
-                [lon_min, lat_min],
-                [lon_max, lat_min],
-                [lon_max, lat_max],
-                [lon_min, lat_max],
-                [lon_min, lat_min]
-            ])
-            
-            region_mask = labeled == region.label
-            avg_risk = risk_score[region_mask].mean()
-            area_km2 = region.area * (km_per_pixel ** 2)
+
+            # Emit GeoJSON coordinates directly; no GEOS round-trip needed
+            # for an axis-aligned box
+            geometry = {
+                "type": "Polygon",
+                "coordinates": [[
+                    [lon_min, lat_min],
+                    [lon_max, lat_min],
+                    [lon_max, lat_max],
+                    [lon_min, lat_max],
+                    [lon_min, lat_min]
+                ]]
+            }
+
+            area_km2 = area * (km_per_pixel ** 2)
             center_lat = (lat_min + lat_max) / 2
             center_lon = (lon_min + lon_max) / 2
             
             feature = {
                 "type": "Feature",
-                "geometry": mapping(polygon),
+                "geometry": geometry,
                 "properties": {
                     "risk_level": level,
                     "risk_score": float(avg_risk),
@@ -4,9 +4,17 @@ Simulated satellite tracking and telemetry
 """
 import math
 import time
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from datetime import datetime, timedelta
-import random
+
+import numpy as np
+
+
+# Dashboards poll every few seconds, so short TTL buckets collapse
+# repeated telemetry/pass computation into cache hits
+TELEMETRY_TTL_SECONDS = 5
+PASS_TTL_SECONDS = 3600
 
 
 # Default satellites to track
@@ -35,11 +43,9 @@ def generate_satellite_position(satellite_id: int, t: float = None) -> Dict:
     """
     if t is None:
         t = time.time()
-    
-    # Use satellite_id as seed for unique orbital parameters
-    random.seed(satellite_id)
-    
-    # Orbital parameters (varied per satellite)
+
+    # Orbital parameters (varied per satellite; purely deterministic in
+    # satellite_id, no RNG involved)
     freq_lat = 0.01 + (satellite_id * 0.002)
     freq_lon = 0.015 + (satellite_id * 0.001)
     phase_lat = satellite_id * 0.5
@@ -67,29 +73,49 @@ def generate_satellite_position(satellite_id: int, t: float = None) -> Dict:
 def predict_next_pass(satellite: Dict, observer_lat: float = 26.0, observer_lon: float = 92.0) -> Dict:
     """
     Predict next visible pass for a satellite
-    
+
+    Results are memoized per hour bucket so repeated polling from the
+    dashboard reuses the same prediction instead of recomputing it.
+
     Args:
         satellite: Satellite dictionary
         observer_lat: Observer latitude
         observer_lon: Observer longitude
-    
+
     Returns:
         Dictionary with pass prediction details
     """
+    hour_bucket = int(time.time() // PASS_TTL_SECONDS)
+    return dict(_next_pass_cached(
+        satellite["name"],
+        satellite["norad_id"],
+        round(observer_lat, 2),
+        round(observer_lon, 2),
+        hour_bucket,
+    ))
+
+
+@lru_cache(maxsize=512)
+def _next_pass_cached(name: str, norad_id: int, observer_lat: float,
+                      observer_lon: float, hour_bucket: int) -> Dict:
+    """Compute a pass prediction for one satellite/observer/hour bucket"""
     # Simulate pass prediction
     now = datetime.now()
-    
+
+    # Deterministic per-satellite stream: PCG64 is O(1) to seed and does
+    # not touch shared global RNG state
+    rng = np.random.default_rng(norad_id)
+
     # Random pass time between 1-12 hours from now
-    random.seed(satellite["norad_id"])
-    hours_until_pass = random.uniform(1, 12)
+    hours_until_pass = rng.uniform(1, 12)
     pass_start = now + timedelta(hours=hours_until_pass)
-    
+
     # Pass duration 2-10 minutes
-    duration_minutes = random.randint(2, 10)
+    duration_minutes = int(rng.integers(2, 11))
     pass_end = pass_start + timedelta(minutes=duration_minutes)
-    
+
     # Maximum elevation angle (10-90 degrees)
-    max_elevation = random.randint(10, 90)
+    max_elevation = int(rng.integers(10, 91))
     
     # Visibility quality based on elevation
     if max_elevation >= 60:
@@ -102,7 +128,7 @@ def predict_next_pass(satellite: Dict, observer_lat: float = 26.0, observer_lon:
         visibility = "Poor"
     
     return {
-        "satellite_name": satellite["name"],
+        "satellite_name": name,
         "start_time": pass_start.isoformat(),
         "end_time": pass_end.isoformat(),
         "duration_seconds": duration_minutes * 60,
@@ -116,30 +142,100 @@ def predict_next_pass(satellite: Dict, observer_lat: float = 26.0, observer_lon:
 def get_satellite_telemetry(satellite: Dict) -> Dict:
     """
     Get detailed telemetry data for a satellite
-    
+
+    Memoized in short time buckets; pollers hitting the endpoint at 1 Hz
+    get cached telemetry instead of re-running the propagation math.
+
     Args:
         satellite: Satellite dictionary
-    
+
     Returns:
         Dictionary with telemetry data
     """
-    position = generate_satellite_position(satellite["id"])
-    
-    # Additional telemetry (simulated)
-    random.seed(satellite["norad_id"])
-    
+    time_bucket = int(time.time() // TELEMETRY_TTL_SECONDS)
+    return dict(_telemetry_cached(satellite["id"], satellite["norad_id"], time_bucket))
+
+
+@lru_cache(maxsize=512)
+def _telemetry_cached(satellite_id: int, norad_id: int, time_bucket: int) -> Dict:
+    """Compute telemetry for one satellite/time bucket"""
+    position = generate_satellite_position(satellite_id)
+
+    # Additional telemetry (simulated) from a per-satellite stream
+    rng = np.random.default_rng(norad_id)
+
     return {
         **position,
-        "signal_strength": round(random.uniform(75, 98), 1),
-        "battery_level": round(random.uniform(85, 100), 1),
-        "temperature_c": round(random.uniform(-20, 45), 1),
-        "solar_panel_power_w": round(random.uniform(200, 800), 1),
-        "data_rate_mbps": round(random.uniform(10, 150), 2),
-        "orbit_number": random.randint(10000, 50000),
+        "signal_strength": round(rng.uniform(75, 98), 1),
+        "battery_level": round(rng.uniform(85, 100), 1),
+        "temperature_c": round(rng.uniform(-20, 45), 1),
+        "solar_panel_power_w": round(rng.uniform(200, 800), 1),
+        "data_rate_mbps": round(rng.uniform(10, 150), 2),
+        "orbit_number": int(rng.integers(10000, 50001)),
         "timestamp": datetime.now().isoformat(),
     }
 
 
+def generate_constellation_telemetry(satellites: List[Dict]) -> List[Dict]:
+    """
+    Generate telemetry for a whole constellation in one vectorized pass
+
+    Propagates every satellite's position with batched array math instead
+    of one Python call per satellite, and shares the same TTL buckets as
+    get_satellite_telemetry.
+
+    Args:
+        satellites: List of satellite dictionaries
+
+    Returns:
+        List of telemetry dictionaries, one per satellite
+    """
+    if not satellites:
+        return []
+
+    time_bucket = int(time.time() // TELEMETRY_TTL_SECONDS)
+    key = tuple((sat["id"], sat["norad_id"]) for sat in satellites)
+    return [dict(t) for t in _constellation_cached(key, time_bucket)]
+
+
+@lru_cache(maxsize=64)
+def _constellation_cached(key: Tuple[Tuple[int, int], ...], time_bucket: int) -> Tuple[Dict, ...]:
+    """Compute telemetry for a set of satellites in one array pass"""
+    t = time.time()
+    ids = np.array([sat_id for sat_id, _ in key], dtype=np.float64)
+
+    # Same Lissajous orbital model as generate_satellite_position, applied
+    # to all satellites at once
+    freq_lat = 0.01 + ids * 0.002
+    freq_lon = 0.015 + ids * 0.001
+    lats = np.round(45 * np.sin(freq_lat * t + ids * 0.5), 6)
+    lons = np.round(180 * np.sin(freq_lon * t + ids * 0.7), 6)
+    altitudes = np.round(400 + ids * 50 + 50 * np.sin(freq_lat * t * 0.5), 2)
+    velocities = np.round((7.5 + 0.5 * np.sin(t * 0.1 + ids)) * 1000, 2)
+
+    timestamp = datetime.now().isoformat()
+
+    telemetry = []
+    for (sat_id, norad_id), lat, lon, alt, vel in zip(
+            key, lats.tolist(), lons.tolist(), altitudes.tolist(), velocities.tolist()):
+        # Seeded draws match get_satellite_telemetry for the same satellite
+        rng = np.random.default_rng(norad_id)
+        telemetry.append({
+            "latitude": lat,
+            "longitude": lon,
+            "altitude_km": alt,
+            "velocity_kmh": vel,
+            "signal_strength": round(rng.uniform(75, 98), 1),
+            "battery_level": round(rng.uniform(85, 100), 1),
+            "temperature_c": round(rng.uniform(-20, 45), 1),
+            "solar_panel_power_w": round(rng.uniform(200, 800), 1),
+            "data_rate_mbps": round(rng.uniform(10, 150), 2),
+            "orbit_number": int(rng.integers(10000, 50001)),
+            "timestamp": timestamp,
+        })
+    return tuple(telemetry)
+
+
 def calculate_fusion_metrics(satellites: List[Dict]) -> Dict:
     """
     Calculate aggregated data fusion metrics from multiple satellites
@@ -160,9 +256,12 @@ def calculate_fusion_metrics(satellites: List[Dict]) -> Dict:
             "active_satellites_count": 0,
         }
     
-    total_altitude = sum(s.get("altitude_km", 0) for s in satellites)
-    total_velocity = sum(s.get("velocity_kmh", 0) for s in satellites)
-    total_data_rate = sum(s.get("data_rate_mbps", 0) for s in satellites)
+    # One pass over the telemetry list instead of three generator sweeps
+    totals = np.array([
+        [s.get("altitude_km", 0.0), s.get("velocity_kmh", 0.0), s.get("data_rate_mbps", 0.0)]
+        for s in satellites
+    ]).sum(axis=0)
+    total_altitude, total_velocity, total_data_rate = totals.tolist()
     
     # Calculate coverage area (simplified - each satellite covers ~1M km²)
     coverage_per_satellite = 1_000_000  # km²
@@ -0,0 +1,58 @@
+"""
+Spatial index for satellite positions
+SQLite R*Tree-backed index over last-known positions for fast
+"satellites near observer" prefilters
+"""
+import sqlite3
+import threading
+from typing import List
+
+
+class SatelliteSpatialIndex:
+    """
+    R*Tree index of last-known satellite positions keyed by satellite id
+
+    Positions are stored as degenerate bounding boxes, so a bbox query
+    around an observer returns candidate satellites in O(log N) instead
+    of scanning the whole constellation.
+    """
+
+    def __init__(self):
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE sat_rtree USING rtree(id, minLat, maxLat, minLon, maxLon)"
+        )
+
+    def update(self, satellite_id: int, latitude: float, longitude: float) -> None:
+        """Insert or refresh a satellite's last-known position"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sat_rtree VALUES (?, ?, ?, ?, ?)",
+                (satellite_id, latitude, latitude, longitude, longitude),
+            )
+
+    def remove(self, satellite_id: int) -> None:
+        """Drop a satellite from the index"""
+        with self._lock:
+            self._conn.execute("DELETE FROM sat_rtree WHERE id = ?", (satellite_id,))
+
+    def query_radius(self, lat: float, lon: float, radius_deg: float) -> List[int]:
+        """
+        Return ids of satellites within a bounding box around a point
+
+        Args:
+            lat: Center latitude
+            lon: Center longitude
+            radius_deg: Half-width of the search box in degrees
+
+        Returns:
+            List of satellite ids intersecting the box
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM sat_rtree "
+                "WHERE maxLat >= ? AND minLat <= ? AND maxLon >= ? AND minLon <= ?",
+                (lat - radius_deg, lat + radius_deg, lon - radius_deg, lon + radius_deg),
+            ).fetchall()
+        return [int(row[0]) for row in rows]